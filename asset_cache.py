@@ -0,0 +1,177 @@
+"""
+Asset cache for Math Adventure Game
+Keeps decoded images in memory under a byte budget with LRU eviction, so
+screens that are redrawn every frame never decode the same file twice.
+Images are converted to the display pixel format once, when they are loaded.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pygame
+
+from asset_pack import AssetSource
+
+# Root of the caches the game writes at runtime (pixel, extracted audio, video stills). They live in
+# the user's home rather than next to the game, which may be read-only or a PyInstaller temp dir
+USER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".math_adventure")
+
+
+def surface_size_bytes(surface: pygame.Surface) -> int:
+    """Approximate memory used by a surface's pixel data"""
+    return surface.get_pitch() * surface.get_height()
+
+
+def convert_surface(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a surface to the display pixel format so blits skip per-pixel conversion.
+
+    Images with per-pixel transparency (PNG alpha) use convert_alpha, opaque images
+    (JPEGs, colorkeyed GIFs) use convert. Without a display mode the surface is returned as is.
+    """
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+class LazyAsset:
+    """Handle that runs its loader the first time the value is needed"""
+
+    def __init__(self, loader: Callable[[], Any]):
+        self.loader = loader
+        self.loaded = False
+        self._value = None
+
+    def get(self) -> Any:
+        if not self.loaded:
+            self._value = self.loader()
+            self.loaded = True
+        return self._value
+
+    def reset(self):
+        """Forget the loaded value - the loader runs again on the next get()"""
+        self._value = None
+        self.loaded = False
+
+
+class AssetCache:
+    """LRU cache of decoded surfaces bounded by a memory budget in bytes"""
+
+    def __init__(self, budget_bytes: int, name: str = "Asset cache", source: Optional[AssetSource] = None):
+        self.name = name
+        # Where images are read from - the asset pack if loaded, otherwise loose files
+        self.source = source or AssetSource()
+        self.budget_bytes = budget_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()  # key -> (surface, size in bytes)
+        self._missing_paths = set()  # Paths already known not to exist
+        # Optional hook mapping a source path to the file actually decoded (e.g. a baked tier)
+        self.path_resolver: Optional[Callable[[str], str]] = None
+
+        # Counters for get_stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        """Return a cached surface and mark it as most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, surface: pygame.Surface):
+        """Store a surface, evicting least recently used entries to stay in budget"""
+        size = surface_size_bytes(surface)
+        self.invalidate(key)
+
+        # Surfaces larger than the whole budget are returned to the caller but never cached
+        if size > self.budget_bytes:
+            return
+
+        while self._entries and self.current_bytes + size > self.budget_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+
+        self._entries[key] = (surface, size)
+        self.current_bytes += size
+
+    def load_image(self, path: str) -> Optional[pygame.Surface]:
+        """Load an image through the cache - returns None if the file does not exist.
+
+        Decode errors are raised as pygame.error, like pygame.image.load.
+        """
+        surface = self.get(path)
+        if surface is not None:
+            return surface
+
+        if path in self._missing_paths:
+            return None
+        load_path = self.resolve_load_path(path)
+        if load_path is None:
+            self._missing_paths.add(path)
+            return None
+
+        surface = convert_surface(self.source.load_image(load_path))
+        self.put(path, surface)
+        return surface
+
+    def resolve_load_path(self, path: str) -> Optional[str]:
+        """Get the file decoded for a source path (None if missing) - safe to call from worker threads"""
+        load_path = self.path_resolver(path) if self.path_resolver else path
+        if load_path != path and not self.source.exists(load_path):
+            load_path = path
+        if not self.source.exists(load_path):
+            return None
+        return load_path
+
+    def contains(self, key: Hashable) -> bool:
+        """Check for an entry without counting a hit or miss"""
+        return key in self._entries
+
+    def convert_all(self):
+        """Re-convert every cached surface to the current display pixel format"""
+        self.current_bytes = 0
+        for key, (surface, _) in self._entries.items():
+            surface = convert_surface(surface)
+            size = surface_size_bytes(surface)
+            self._entries[key] = (surface, size)
+            self.current_bytes += size
+
+    def invalidate(self, key: Hashable):
+        """Drop a single entry from the cache"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+
+    def clear(self):
+        """Drop every cached surface (counters are kept)"""
+        self._entries.clear()
+        self._missing_paths.clear()
+        self.current_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current memory use"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'budget_bytes': self.budget_bytes,
+        }
+
+    def format_stats(self) -> str:
+        """Return a one-line summary of the cache counters"""
+        stats = self.get_stats()
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = (stats['hits'] / lookups * 100) if lookups else 0.0
+        return (f"{self.name}: {stats['hits']} hits, {stats['misses']} misses ({hit_rate:.1f}% hit rate), "
+                f"{stats['evictions']} evictions, {stats['entries']} entries, "
+                f"{stats['bytes'] / (1024 * 1024):.1f}/{stats['budget_bytes'] / (1024 * 1024):.0f} MB")
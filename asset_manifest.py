@@ -0,0 +1,162 @@
+"""
+Asset manifest for Math Adventure Game
+Resolves every sublevel's question images and audio once, at startup (or from
+`baked/manifest.json` written by `python bake_assets.py manifest`), so starting
+a sublevel is a dictionary lookup instead of listdir/exists probing.
+
+A baked manifest records a fingerprint of the file names it was built from, so
+art added, renamed or removed after baking is noticed with one listdir per
+folder and the manifest is rebuilt instead of pointing at missing files.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, Optional
+
+from asset_pack import AssetSource
+from asset_tiers import BAKED_ASSETS_DIR
+
+MANIFEST_VERSION = 2
+MANIFEST_FILE = "manifest.json"
+QUESTION_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+# Every sublevel from "1.1" to "10.3"
+ALL_SUBLEVELS = [f"{level_num}.{sublevel_num}" for level_num in range(1, 11) for sublevel_num in range(1, 4)]
+
+BACKGROUND_MUSIC_PATH = "assets/audio/BACKGROUND MUSIC/BACKGROUND MUSIC.mp3"
+EXERCISE_IMAGE_PATHS = [f"assets/photos/EXERCISES/EXERCISE ({i}).jpg" for i in range(1, 11)]
+INTRO_AUDIO_PATHS = [
+    "assets/photos/intro/intro (1) .mp4",
+    "assets/photos/intro/intro (2) before showing the map.mp4",
+]
+VOICE_OVER_DIR = "assets/audio/VOICE OVER"
+# Files in the scanned folders that the manifest depends on (all of them are packed, so
+# the fingerprint is the same from loose files and from assets.pack)
+FINGERPRINT_EXTENSIONS = QUESTION_IMAGE_EXTENSIONS + ('.mp3',)
+
+
+def get_sublevel_dir(sublevel_string: str) -> str:
+    """Get the relative directory holding a sublevel's question images"""
+    return f"assets/photos/LEVEL {sublevel_string}"
+
+
+def compute_fingerprint(sublevels: List[str], source: AssetSource, resolve_path: Callable[[str], str]) -> str:
+    """Hash the question/voice-over file names and fixed asset paths a manifest is built from"""
+    content_hash = hashlib.sha1()
+    for relative_dir in [get_sublevel_dir(sublevel_string) for sublevel_string in sublevels] + [VOICE_OVER_DIR]:
+        try:
+            names = sorted(name for name in source.listdir(resolve_path(relative_dir))
+                           if name.lower().endswith(FINGERPRINT_EXTENSIONS))
+        except OSError:
+            names = None  # Folder missing
+        content_hash.update(f"{relative_dir}:{names}\n".encode("utf-8"))
+    for path in [BACKGROUND_MUSIC_PATH] + EXERCISE_IMAGE_PATHS + INTRO_AUDIO_PATHS:
+        content_hash.update(f"{path}:{source.exists(resolve_path(path))}\n".encode("utf-8"))
+    return content_hash.hexdigest()
+
+
+class AssetManifest:
+    """Sublevel questions, exercise images and intro audio resolved to relative asset paths"""
+
+    def __init__(self, data: Dict, resolve_path: Callable[[str], str]):
+        self.data = data
+        self.resolve_path = resolve_path
+
+    @classmethod
+    def build(cls, sublevels: List[str], source: AssetSource, resolve_path: Callable[[str], str]) -> "AssetManifest":
+        """Scan the asset folders once and record everything the loaders need"""
+        def exists(relative_path: str) -> bool:
+            return source.exists(resolve_path(relative_path))
+
+        background_music = BACKGROUND_MUSIC_PATH if exists(BACKGROUND_MUSIC_PATH) else None
+
+        sublevel_questions = {}
+        for sublevel_string in sublevels:
+            level_dir = get_sublevel_dir(sublevel_string)
+            if not exists(level_dir):
+                continue
+
+            question_files = sorted(
+                file for file in source.listdir(resolve_path(level_dir))
+                if file.lower().endswith(QUESTION_IMAGE_EXTENSIONS)
+            )
+            main_level = int(sublevel_string.split('.')[0])
+
+            questions = []
+            for question_file in question_files:
+                # Audio priority: 1. VOICE OVER directory, 2. Level directory, 3. Background music
+                audio_file_name = question_file.rsplit('.', 1)[0] + '.mp3'  # e.g., "22.mp3"
+                if question_file == '22.jpg' and main_level == 1:
+                    # Special case for 22.jpg - use lvl 1.mp3 in level directory
+                    level_audio_file = 'lvl 1.mp3'
+                else:
+                    level_audio_file = audio_file_name
+
+                candidates = [f"{VOICE_OVER_DIR}/{audio_file_name}", f"{level_dir}/{level_audio_file}"]
+                audio_path = next((path for path in candidates if exists(path)), background_music)
+
+                questions.append({
+                    'file': question_file,
+                    'image_path': f"{level_dir}/{question_file}",
+                    'audio_path': audio_path,
+                })
+            sublevel_questions[sublevel_string] = questions
+
+        data = {
+            'version': MANIFEST_VERSION,
+            'fingerprint': compute_fingerprint(sublevels, source, resolve_path),
+            'sublevels': sublevel_questions,
+            'exercise_images': [path if exists(path) else None for path in EXERCISE_IMAGE_PATHS],
+            'intro_audio': [path for path in INTRO_AUDIO_PATHS if exists(path)],
+        }
+        return cls(data, resolve_path)
+
+    @classmethod
+    def load_or_build(cls, sublevels: List[str], source: AssetSource,
+                      resolve_path: Callable[[str], str]) -> "AssetManifest":
+        """Load the baked manifest if present, otherwise build one by scanning the assets"""
+        manifest_path = resolve_path(os.path.join(BAKED_ASSETS_DIR, MANIFEST_FILE))
+        if source.exists(manifest_path):
+            try:
+                data = json.loads(source.read_bytes(manifest_path).decode("utf-8"))
+                if data.get('version') != MANIFEST_VERSION:
+                    print(f"Asset manifest {manifest_path} is out of date, rescanning assets")
+                elif data.get('fingerprint') != compute_fingerprint(sublevels, source, resolve_path):
+                    print(f"Assets changed since {manifest_path} was baked, rescanning assets")
+                else:
+                    print(f"Loaded asset manifest: {manifest_path}")
+                    return cls(data, resolve_path)
+            except (OSError, ValueError) as e:
+                print(f"Error loading asset manifest, rescanning assets: {e}")
+
+        manifest = cls.build(sublevels, source, resolve_path)
+        question_count = sum(len(questions) for questions in manifest.data['sublevels'].values())
+        print(f"Built asset manifest: {len(manifest.data['sublevels'])} sublevels, {question_count} questions")
+        return manifest
+
+    def save(self, manifest_path: str):
+        """Write the manifest as JSON (paths stay relative to the project root)"""
+        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(self.data, manifest_file, indent=1, sort_keys=True)
+
+    def _resolve(self, relative_path: Optional[str]) -> Optional[str]:
+        return self.resolve_path(relative_path) if relative_path else None
+
+    def get_questions(self, sublevel_string: str) -> List[Dict]:
+        """Get a sublevel's ordered questions with absolute image and audio paths"""
+        return [
+            {
+                'file': question['file'],
+                'image_path': self._resolve(question['image_path']),
+                'audio_path': self._resolve(question['audio_path']),
+            }
+            for question in self.data['sublevels'].get(sublevel_string, [])
+        ]
+
+    def get_exercise_image_paths(self) -> List[Optional[str]]:
+        """Get absolute exercise image paths (None where the image is missing)"""
+        return [self._resolve(path) for path in self.data['exercise_images']]
+
+    def get_intro_audio_paths(self) -> List[str]:
+        """Get absolute paths of the intro audio files that exist"""
+        return [self._resolve(path) for path in self.data['intro_audio']]
@@ -0,0 +1,201 @@
+"""
+Asset pack for Math Adventure Game
+A single file holding every image and audio asset behind a header index, read
+through mmap. Built with `python bake_assets.py pack`.
+
+Layout:
+  magic (4 bytes) | version (uint32) | index size (uint32) | index JSON | file data
+The index maps each relative asset path to [offset, length, type], with offsets
+counted from the start of the file data.
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+PACK_MAGIC = b"MAPK"
+PACK_VERSION = 1
+ASSET_PACK_FILE = "assets.pack"
+PACK_HEADER = struct.Struct("<4sII")
+
+# Asset types stored in the index, by file extension
+ASSET_TYPES = {
+    '.jpg': 'image', '.jpeg': 'image', '.png': 'image', '.bmp': 'image', '.gif': 'image', '.tga': 'image',
+    '.mp3': 'audio', '.wav': 'audio', '.ogg': 'audio',
+    '.json': 'data',
+}
+
+
+def get_asset_type(path: str) -> Optional[str]:
+    """Get the pack type for a file, or None if it should stay a loose file"""
+    return ASSET_TYPES.get(os.path.splitext(path)[1].lower())
+
+
+def write_pack(output_path: str, files: List[Tuple[str, str]]):
+    """Write an asset pack from (relative path, file path on disk) pairs"""
+    index = {}
+    offset = 0
+    for relative_path, file_path in files:
+        length = os.path.getsize(file_path)
+        index[relative_path] = [offset, length, get_asset_type(relative_path)]
+        offset += length
+    index_bytes = json.dumps({"files": index}, sort_keys=True).encode("utf-8")
+
+    with open(output_path, "wb") as pack_file:
+        pack_file.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes)))
+        pack_file.write(index_bytes)
+        for _, file_path in files:
+            with open(file_path, "rb") as source_file:
+                pack_file.write(source_file.read())
+
+
+class PackedFile(io.RawIOBase):
+    """Read-only, seekable file object over one entry of a memory-mapped pack"""
+
+    def __init__(self, mapped: mmap.mmap, offset: int, length: int):
+        super().__init__()
+        self._view = memoryview(mapped)[offset:offset + length]
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = min(len(buffer), len(self._view) - self._position)
+        if count <= 0:
+            return 0
+        buffer[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = len(self._view) + offset
+        self._position = max(0, self._position)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class AssetPack:
+    """Memory-mapped asset pack reader"""
+
+    def __init__(self, pack_path: str):
+        self.pack_path = pack_path
+        self._file = open(pack_path, "rb")
+        self._mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, index_size = PACK_HEADER.unpack_from(self._mapped, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Not a version {PACK_VERSION} asset pack: {pack_path}")
+
+        index_bytes = self._mapped[PACK_HEADER.size:PACK_HEADER.size + index_size]
+        self.index: Dict[str, List] = json.loads(index_bytes.decode("utf-8"))["files"]
+        self.data_start = PACK_HEADER.size + index_size
+
+        # Directory listings so listdir never touches the disk
+        self.directories: Dict[str, List[str]] = {}
+        for relative_path in self.index:
+            directory, name = relative_path.rsplit("/", 1) if "/" in relative_path else ("", relative_path)
+            self.directories.setdefault(directory, []).append(name)
+
+    @classmethod
+    def open_if_exists(cls, pack_path: str) -> Optional["AssetPack"]:
+        """Open the asset pack if it exists - returns None for loose-file mode"""
+        if not os.path.exists(pack_path):
+            return None
+        try:
+            pack = cls(pack_path)
+            print(f"Loaded asset pack: {pack_path} ({len(pack.index)} files)")
+            return pack
+        except (OSError, ValueError) as e:
+            print(f"Error loading asset pack, using loose files: {e}")
+            return None
+
+    def contains(self, relative_path: str) -> bool:
+        return relative_path in self.index
+
+    def open(self, relative_path: str) -> Optional[PackedFile]:
+        """Open a packed file without copying its data"""
+        entry = self.index.get(relative_path)
+        if entry is None:
+            return None
+        return PackedFile(self._mapped, self.data_start + entry[0], entry[1])
+
+    def listdir(self, relative_dir: str) -> Optional[List[str]]:
+        return self.directories.get(relative_dir.rstrip("/"))
+
+    def close(self):
+        self._mapped.close()
+        self._file.close()
+
+
+class AssetSource:
+    """Looks assets up in the asset pack first, then falls back to loose files on disk"""
+
+    def __init__(self, base_path: str = "", pack: Optional[AssetPack] = None):
+        self.base_path = base_path
+        self.pack = pack
+
+    def relative(self, path: str) -> Optional[str]:
+        """Get the pack key for an absolute resource path"""
+        if self.pack is None:
+            return None
+        relative_path = os.path.relpath(path, self.base_path).replace(os.sep, "/")
+        return None if relative_path.startswith("..") else relative_path
+
+    def exists(self, path: str) -> bool:
+        relative_path = self.relative(path)
+        if relative_path is not None and (self.pack.contains(relative_path) or self.pack.listdir(relative_path)):
+            return True
+        return os.path.exists(path)
+
+    def listdir(self, path: str) -> List[str]:
+        relative_path = self.relative(path)
+        if relative_path is not None:
+            names = self.pack.listdir(relative_path)
+            if names is not None:
+                return list(names)
+        return os.listdir(path)
+
+    def open(self, path: str) -> Optional[PackedFile]:
+        """Open a packed asset - returns None if the asset is only available as a loose file"""
+        relative_path = self.relative(path)
+        if relative_path is None:
+            return None
+        return self.pack.open(relative_path)
+
+    def read_bytes(self, path: str) -> bytes:
+        packed_file = self.open(path)
+        if packed_file is not None:
+            with packed_file:
+                return packed_file.read()
+        with open(path, "rb") as loose_file:
+            return loose_file.read()
+
+    def load_image(self, path: str) -> pygame.Surface:
+        """Decode an image straight from the mapped pack, or from disk"""
+        packed_file = self.open(path)
+        if packed_file is None:
+            return pygame.image.load(path)
+        with packed_file:
+            return pygame.image.load(packed_file, os.path.basename(path))
@@ -0,0 +1,68 @@
+"""
+Background prefetching for Math Adventure Game
+Decodes upcoming images on a worker thread while the current screen is shown.
+Results are handed back to the main thread through a queue, where images are
+converted and stored in the asset cache.
+"""
+
+import queue
+import threading
+
+import pygame
+
+from asset_cache import AssetCache, convert_surface
+
+
+class AssetPrefetcher:
+    """Worker thread that decodes images ahead of time"""
+
+    def __init__(self, asset_cache: AssetCache):
+        self.asset_cache = asset_cache
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._pending = set()  # Paths requested but not yet handed back (main thread only)
+        self._thread = threading.Thread(target=self._worker, name="AssetPrefetcher", daemon=True)
+        self._thread.start()
+
+    def request_image(self, path: str):
+        """Queue an image for decoding unless it is cached or already queued"""
+        if not path or path in self._pending or self.asset_cache.contains(path):
+            return
+        self._pending.add(path)
+        self._requests.put(('image', path))
+
+    def poll(self):
+        """Move finished work into the asset cache - call once per frame from the main thread"""
+        while True:
+            try:
+                kind, path, result = self._results.get_nowait()
+            except queue.Empty:
+                return
+            self._pending.discard(path)
+            if result is None:
+                continue
+            if kind == 'image':
+                # Display conversion must happen on the main thread
+                if not self.asset_cache.contains(path):
+                    self.asset_cache.put(path, convert_surface(result))
+
+    def stop(self):
+        """Stop the worker thread"""
+        self._requests.put(None)
+        self._thread.join(timeout=1.0)
+
+    def _worker(self):
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            kind, path = request
+            result = None
+            try:
+                if kind == 'image':
+                    load_path = self.asset_cache.resolve_load_path(path)
+                    if load_path is not None:
+                        result = self.asset_cache.source.load_image(load_path)
+            except (pygame.error, OSError) as e:
+                print(f"Error prefetching {path}: {e}")
+            self._results.put((kind, path, result))
@@ -0,0 +1,88 @@
+"""
+Resolution tiers for Math Adventure Game
+Maps source images to pre-rendered copies produced by `python bake_assets.py tiers`,
+so the game decodes the smallest image that still covers the window instead of
+decoding full-size source art and downscaling it at runtime.
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+from asset_pack import AssetSource
+
+# Widths baked by bake_assets.py - the game picks the smallest one that covers the window
+TIER_WIDTHS = (1024, 1600, 2560, 3840)
+BAKED_ASSETS_DIR = "baked"
+TIER_INDEX_FILE = "tiers.json"
+
+
+def select_tier_width(window_width: int) -> int:
+    """Get the smallest tier width that covers the window width"""
+    for tier_width in TIER_WIDTHS:
+        if tier_width >= window_width:
+            return tier_width
+    return TIER_WIDTHS[-1]
+
+
+class AssetTiers:
+    """Resolves source image paths to baked tier paths for the current window width"""
+
+    def __init__(self, base_path: str, baked_path: str, source: Optional[AssetSource] = None):
+        self.base_path = base_path
+        self.baked_path = baked_path
+        self.source = source or AssetSource()
+        self.tier_width = TIER_WIDTHS[0]
+        # relative source path -> {"source_width": int, "tiers": {width: relative baked path}}
+        self.index: Dict[str, Dict] = {}
+        self.load_index()
+
+    def load_index(self):
+        """Load the tier index written by the bake tool (missing index = source files only)"""
+        index_path = os.path.join(self.baked_path, TIER_INDEX_FILE)
+        if not self.source.exists(index_path):
+            return
+        try:
+            raw_index = json.loads(self.source.read_bytes(index_path).decode("utf-8"))
+            self.index = {
+                source: {
+                    "source_width": entry["source_width"],
+                    "tiers": {int(width): path for width, path in entry["tiers"].items()},
+                }
+                for source, entry in raw_index.items()
+            }
+            print(f"Loaded baked asset tiers for {len(self.index)} images")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error loading baked asset tiers: {e}")
+            self.index = {}
+
+    def set_window_width(self, window_width: int) -> bool:
+        """Select the tier for a window width - returns True if the tier changed"""
+        tier_width = select_tier_width(window_width)
+        if tier_width == self.tier_width:
+            return False
+        self.tier_width = tier_width
+        return True
+
+    def resolve(self, path: str) -> str:
+        """Get the path to load for a source image at the current tier"""
+        if not self.index:
+            return path
+
+        relative_path = os.path.relpath(path, self.base_path).replace(os.sep, "/")
+        entry = self.index.get(relative_path)
+        if entry is None:
+            return path
+
+        baked_relative = self.pick_tier(entry)
+        if baked_relative is None:
+            return path
+        return os.path.join(self.baked_path, baked_relative)
+
+    def pick_tier(self, entry: Dict) -> Optional[str]:
+        """Pick the smallest baked tier covering the current tier width (None = use the source)"""
+        for width in sorted(entry["tiers"]):
+            if width >= self.tier_width:
+                return entry["tiers"][width]
+        # No baked tier is wide enough - the source is the best available
+        return None
@@ -0,0 +1,100 @@
+"""
+Extracted video audio for Math Adventure Game
+pygame cannot play the audio track of an .mp4, so it is extracted to a WAV file
+once and stored under the hash of the video's content: by
+`python bake_assets.py audio`, or else on a background thread the first time the
+video plays. Extraction runs on a small worker pool and hands out futures.
+Later plays and launches load the stored WAV without extracting or
+blocking the render loop.
+"""
+
+import hashlib
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from asset_cache import USER_CACHE_DIR
+from asset_pack import AssetSource
+from video_pipe import extract_audio, probe_video
+
+AUDIO_CACHE_DIR = os.path.join(USER_CACHE_DIR, "audio_cache")
+# Audio baked by bake_assets.py, inside the baked assets folder
+BAKED_AUDIO_DIR = "audio"
+# Suffix of a WAV still being written (ffmpeg picks the format from the extension)
+PARTIAL_SUFFIX = ".partial.wav"
+
+
+def hash_file(path: str) -> str:
+    """Hash a file's content"""
+    content_hash = hashlib.sha1()
+    with open(path, "rb") as source_file:
+        for chunk in iter(lambda: source_file.read(1024 * 1024), b""):
+            content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+def get_audio_file_name(content_hash: str) -> str:
+    return f"{content_hash}.wav"
+
+
+class AudioExtractCache:
+    """Video audio tracks extracted to WAV files on a worker pool, keyed by video content hash"""
+
+    def __init__(self, cache_dir: str, baked_dir: str, source: Optional[AssetSource] = None, max_workers: int = 2):
+        self.cache_dir = cache_dir
+        self.baked_dir = baked_dir
+        self.source = source or AssetSource()
+        # Bounded, so requesting a batch of videos never starts more ffmpeg processes than this
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="AudioExtract")
+        self._futures: Dict[str, Future] = {}  # Video path -> WAV path job (result None = no audio track)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(PARTIAL_SUFFIX):
+                    # Left behind by a run that quit mid-extraction
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError as e:
+            print(f"Error preparing audio cache {self.cache_dir}: {e}")
+
+    def request(self, video_path: str) -> Future:
+        """Get a video's WAV path as a future (None = no audio) - extracted in the background unless already stored"""
+        future = self._futures.get(video_path)
+        if future is None or future.cancelled():
+            future = self._executor.submit(self._extract, video_path)
+            self._futures[video_path] = future
+        return future
+
+    def shutdown(self):
+        """Stop the worker threads (extractions still running finish in the background)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _extract(self, video_path: str) -> Optional[str]:
+        try:
+            content_hash = hash_file(video_path)
+        except OSError as e:
+            print(f"Error reading video {video_path}: {e}")
+            return None
+        name = get_audio_file_name(content_hash)
+
+        baked_path = os.path.join(self.baked_dir, name)
+        if self.source.exists(baked_path):
+            return baked_path
+        cached_path = os.path.join(self.cache_dir, name)
+        if os.path.exists(cached_path):
+            return cached_path
+
+        info = probe_video(video_path)
+        if info is None or not info.has_audio:
+            return None
+        partial_path = os.path.join(self.cache_dir, content_hash + PARTIAL_SUFFIX)
+        if not extract_audio(video_path, partial_path):
+            return None
+        try:
+            # Only complete files get the final name, so a crash never leaves a truncated WAV behind
+            os.replace(partial_path, cached_path)
+        except OSError as e:
+            print(f"Error storing extracted audio for {video_path}: {e}")
+            return None
+        print(f"Extracted audio: {video_path}")
+        return cached_path
@@ -0,0 +1,108 @@
+"""
+Audio latency modes for Math Adventure Game
+The mixer used pygame's default settings, so a sound started by an answer was
+heard only after the mixer's next callback plus the output buffer, whatever the
+hardware could do. The buffer size sets that delay (512 samples is ~12 ms at
+44.1 kHz): small buffers answer faster but can crackle on slow laptops, large
+ones are safe but sluggish. A latency mode picks the frequency, buffer and
+channel count passed to pygame.mixer.pre_init, and measure_output_latency times
+how long the mixer takes to start mixing a sound that was just scheduled, so a
+mode can be tuned per hardware model (`python benchmarks.py audio-latency`).
+"""
+
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import pygame
+
+from sound_effects import MixProbe
+
+
+class MixerSettings(NamedTuple):
+    frequency: int  # Samples per second
+    buffer: int  # Samples per mixer callback (a power of two)
+    channels: int
+
+    @property
+    def buffer_ms(self) -> float:
+        """Time one mixer buffer takes to play"""
+        return self.buffer * 1000 / self.frequency
+
+    def describe(self) -> str:
+        return f"{self.frequency} Hz, {self.channels} channels, {self.buffer}-sample buffer ({self.buffer_ms:.1f} ms)"
+
+
+# "default" matches pygame 2's own defaults; "low" halves the buffer for snappier feedback;
+# "safe" is for machines where the smaller buffers crackle
+AUDIO_LATENCY_MODES: Dict[str, MixerSettings] = {
+    "default": MixerSettings(44100, 512, 2),
+    "low": MixerSettings(44100, 256, 2),
+    "safe": MixerSettings(44100, 2048, 2),
+}
+
+
+def get_mixer_settings(mode: str, buffer: Optional[int] = None) -> MixerSettings:
+    """Mixer settings for a latency mode, with the buffer size optionally overridden
+
+    Raises ValueError for an unknown mode or a buffer that is not a positive power of two.
+    """
+    if mode not in AUDIO_LATENCY_MODES:
+        raise ValueError(f"Unknown audio latency mode {mode!r} (expected one of {', '.join(AUDIO_LATENCY_MODES)})")
+    settings = AUDIO_LATENCY_MODES[mode]
+    if buffer is not None:
+        if buffer <= 0 or buffer & (buffer - 1):
+            raise ValueError(f"Audio buffer must be a positive power of two, got {buffer}")
+        settings = settings._replace(buffer=buffer)
+    return settings
+
+
+def pre_init_mixer(settings: MixerSettings):
+    """Set the settings the mixer opens with - call before pygame.init()"""
+    pygame.mixer.pre_init(frequency=settings.frequency, size=-16, channels=settings.channels,
+                          buffer=settings.buffer)
+
+
+def reinit_mixer(settings: MixerSettings) -> bool:
+    """Reopen the audio device with new settings (stops every sound) - returns False if it cannot be opened"""
+    pygame.mixer.quit()
+    pre_init_mixer(settings)
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Error opening audio device with {settings.describe()}: {e}")
+        return False
+    return True
+
+
+def measure_output_latency(settings: MixerSettings, trials: int = 20) -> Optional[Dict[str, float]]:
+    """Time scheduled-to-mixed and estimate scheduled-to-audible delay on the open mixer (None without audio)
+
+    A MixProbe is started trials times, each at a random point of the mixer period; the
+    time until it has been mixed is the wait for the next mixer callback. The mixed buffer
+    then waits for the one already queued in the device, so one buffer period is added for
+    the audible estimate. Driver and hardware latency behind the device buffer is not
+    visible to software and comes on top.
+    """
+    mixer_init = pygame.mixer.get_init()
+    if not mixer_init:
+        return None
+    probe = MixProbe()
+    mixed_ms: List[float] = []
+    for _ in range(trials):
+        time.sleep(random.uniform(0.0, 0.05))
+        start = time.perf_counter()
+        probe.start()
+        if probe.wait():
+            mixed_ms.append((time.perf_counter() - start) * 1000)
+    if not mixed_ms:
+        return None
+    mixed_ms.sort()
+    buffer_ms = settings.buffer * 1000 / mixer_init[0]
+    return {
+        'buffer_ms': buffer_ms,
+        'mixed_median_ms': mixed_ms[len(mixed_ms) // 2],
+        'mixed_max_ms': mixed_ms[-1],
+        'audible_median_ms': mixed_ms[len(mixed_ms) // 2] + buffer_ms,
+        'audible_max_ms': mixed_ms[-1] + buffer_ms,
+    }
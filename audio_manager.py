@@ -0,0 +1,253 @@
+"""
+Audio buses for Math Adventure Game
+Everything used to go through the single pygame.mixer.music stream, so most
+screen changes reloaded BACKGROUND MUSIC.mp3 from the start and every voice-over
+stopped the music. AudioManager splits playback into three buses:
+
+- music: pygame.mixer.music, streamed. Asking for the track that is already
+  playing keeps it going instead of opening and decoding it again.
+- voice: voice-overs decoded into a Sound on a worker thread (pygame releases the
+  GIL while decoding) and played on a reserved channel. The music is ducked while
+  a voice plays and fades back up afterwards. The next voice-over can be decoded
+  ahead, and recent ones stay in a VoiceCache under a memory budget, so narration
+  usually starts the frame it is asked for and replays without decoding again.
+- effects: SoundEffects on their own pool of reserved channels.
+"""
+
+import io
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from asset_pack import AssetSource
+from sound_effects import MIX_PROBE_CHANNEL, SFX_CHANNELS, SoundEffects
+
+# Mixer channel reserved for voice-overs
+VOICE_CHANNEL = 0
+# Music volume, and the volume it is ducked to while a voice-over plays
+MUSIC_VOLUME = 1.0
+DUCKED_MUSIC_VOLUME = 0.3
+# Time the music takes to fade between the two volumes
+DUCK_FADE_MS = 250
+# Voice-overs decoded at once (the one asked for and the one decoded ahead)
+VOICE_DECODE_WORKERS = 2
+
+
+def sound_size_bytes(sound: pygame.mixer.Sound) -> int:
+    """Approximate memory used by a Sound's samples in the mixer's format"""
+    frequency, sample_format, channels = pygame.mixer.get_init() or (44100, -16, 2)
+    return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
+
+
+class VoiceCache:
+    """LRU cache of decoded voice-overs bounded by a memory budget in bytes"""
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, Tuple[pygame.mixer.Sound, int]]" = OrderedDict()
+
+        # Counters for format_stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._entries
+
+    def get(self, path: str) -> Optional[pygame.mixer.Sound]:
+        """Return a decoded voice-over and mark it as most recently used"""
+        entry = self._entries.get(path)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(path)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, path: str, sound: pygame.mixer.Sound):
+        """Store a voice-over, evicting least recently used ones to stay in budget"""
+        size = sound_size_bytes(sound)
+        old_entry = self._entries.pop(path, None)
+        if old_entry is not None:
+            self.current_bytes -= old_entry[1]
+        # Clips larger than the whole budget are played but never cached
+        if size > self.budget_bytes:
+            return
+        while self._entries and self.current_bytes + size > self.budget_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+        self._entries[path] = (sound, size)
+        self.current_bytes += size
+
+    def format_stats(self) -> str:
+        return (f"Voice cache: {len(self._entries)} clips, {self.current_bytes / (1024 * 1024):.1f}/"
+                f"{self.budget_bytes / (1024 * 1024):.0f} MB, {self.hits} hits, {self.misses} misses, "
+                f"{self.evictions} evictions")
+
+
+class AudioManager:
+    """Music, voice-over and sound effect buses on one pygame mixer"""
+
+    def __init__(self, effect_paths: Dict[str, str], source: Optional[AssetSource] = None,
+                 voice_cache_bytes: int = 32 * 1024 * 1024):
+        self.source = source or AssetSource()
+        self.effects = SoundEffects(effect_paths, self.source)
+
+        self.music_path: Optional[str] = None  # Track loaded into the music stream
+        self._music_file = None  # The mixer streams from the file object, so keep it alive until the next load
+        self._music_volume = MUSIC_VOLUME
+        self._last_update_ticks: Optional[int] = None
+
+        self.voice_path: Optional[str] = None  # Voice-over on the voice channel
+        self._voice_sound: Optional[pygame.mixer.Sound] = None
+        # (path, decode job, time.perf_counter() of the request) until it plays
+        self._pending_voice: Optional[Tuple[str, Future, float]] = None
+        self._voice_channel: Optional[pygame.mixer.Channel] = None
+        self.voice_cache = VoiceCache(voice_cache_bytes)
+        self._decoding: Dict[str, Future] = {}  # Path -> decode job, until it is in the cache
+        self._executor = ThreadPoolExecutor(max_workers=VOICE_DECODE_WORKERS, thread_name_prefix="VoiceDecode")
+
+        # Counters for format_stats()
+        self.music_loads = 0
+        self.music_kept = 0  # Requests for the track already playing
+        self.voice_plays = 0
+        self.voice_start_delays_ms: List[float] = []  # Request -> voice channel playing, per voice-over
+
+        if pygame.mixer.get_init():
+            pygame.mixer.set_reserved(max(VOICE_CHANNEL, *SFX_CHANNELS, MIX_PROBE_CHANNEL) + 1)
+            self._voice_channel = pygame.mixer.Channel(VOICE_CHANNEL)
+            pygame.mixer.music.set_volume(self._music_volume)
+
+    def play_music(self, path: str, loops: int = -1, start: float = 0.0) -> bool:
+        """Stream a track on the music bus - returns False if it was already playing and is kept going
+
+        A start position always reloads, so soundtracks can join their video where it is.
+        Raises pygame.error if the track cannot be played.
+        """
+        if start == 0.0 and path == self.music_path and pygame.mixer.music.get_busy():
+            self.music_kept += 1
+            return False
+        music_file = self.source.open(path)
+        if music_file is None:
+            pygame.mixer.music.load(path)
+        else:
+            pygame.mixer.music.load(music_file, os.path.basename(path))
+        self._music_file = music_file
+        self.music_path = path
+        pygame.mixer.music.play(loops, start=start)
+        self.music_loads += 1
+        return True
+
+    def stop_music(self):
+        pygame.mixer.music.stop()
+        self.music_path = None
+
+    def play_voice(self, path: str):
+        """Play a voice-over (replaces the current one) - at once if decoded, else once its decode finishes"""
+        self.stop_voice()
+        requested = time.perf_counter()
+        sound = self.voice_cache.get(path)
+        if sound is None:
+            future = self._decode(path)
+            if not future.done():
+                self._pending_voice = (path, future, requested)
+                return
+            # Decoded ahead but not moved into the cache yet
+            try:
+                sound = future.result()
+            except (OSError, pygame.error) as e:
+                print(f"Error playing voice-over {path}: {e}")
+                return
+        self._start_voice(path, sound, requested)
+
+    def prefetch_voice(self, path: str):
+        """Decode a voice-over in the background into the voice cache, ready for play_voice"""
+        if path and path not in self.voice_cache and path not in self._decoding:
+            self._decode(path)
+
+    def stop_voice(self):
+        """Stop the voice-over (one still decoding is cached but not played)"""
+        self._pending_voice = None
+        if self._voice_channel is not None:
+            self._voice_channel.stop()
+        self.voice_path = None
+        self._voice_sound = None
+
+    @property
+    def voice_busy(self) -> bool:
+        """A voice-over is decoding or playing"""
+        return self._pending_voice is not None or (self._voice_channel is not None and self._voice_channel.get_busy())
+
+    def update(self, now_ms: int):
+        """Cache decoded voice-overs, start the one asked for and move the music volume
+        toward its ducked level - call once per frame"""
+        for path, future in list(self._decoding.items()):
+            if not future.done():
+                continue
+            del self._decoding[path]
+            try:
+                self.voice_cache.put(path, future.result())
+            except (OSError, pygame.error) as e:
+                print(f"Error decoding voice-over {path}: {e}")
+
+        if self._pending_voice is not None and self._pending_voice[1].done():
+            path, future, requested = self._pending_voice
+            self._pending_voice = None
+            try:
+                self._start_voice(path, future.result(), requested)
+            except (OSError, pygame.error) as e:
+                print(f"Error playing voice-over {path}: {e}")
+
+        elapsed_ms = now_ms - self._last_update_ticks if self._last_update_ticks is not None else 0
+        self._last_update_ticks = now_ms
+        voice_playing = self._voice_channel is not None and self._voice_channel.get_busy()
+        target = DUCKED_MUSIC_VOLUME if voice_playing else MUSIC_VOLUME
+        if self._music_volume != target:
+            step = (MUSIC_VOLUME - DUCKED_MUSIC_VOLUME) * elapsed_ms / DUCK_FADE_MS
+            if self._music_volume > target:
+                self._music_volume = max(target, self._music_volume - step)
+            else:
+                self._music_volume = min(target, self._music_volume + step)
+            pygame.mixer.music.set_volume(self._music_volume)
+
+    def format_stats(self) -> str:
+        """Return a one-line summary of the buses"""
+        summary = (f"Audio: {self.music_loads} music loads, {self.music_kept} requests kept the playing track, "
+                   f"{self.voice_plays} voice-overs")
+        if self.voice_start_delays_ms:
+            delays = sorted(self.voice_start_delays_ms)
+            summary += f" (start delay median {delays[len(delays) // 2]:.1f} ms, max {delays[-1]:.1f} ms)"
+        return summary
+
+    def shutdown(self):
+        """Stop the voice decode and effect latency threads"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.effects.shutdown()
+
+    def _start_voice(self, path: str, sound: pygame.mixer.Sound, requested: float):
+        if self._voice_channel is None:
+            return
+        self._voice_sound = sound
+        self._voice_channel.play(sound)
+        self.voice_path = path
+        self.voice_plays += 1
+        delay_ms = (time.perf_counter() - requested) * 1000
+        self.voice_start_delays_ms.append(delay_ms)
+        print(f"Playing voice-over: {path} ({delay_ms:.1f} ms after it was asked for)")
+
+    def _decode(self, path: str) -> Future:
+        """Start decoding a voice-over, or join the decode already running"""
+        future = self._decoding.get(path)
+        if future is None:
+            future = self._executor.submit(self._decode_voice, path)
+            self._decoding[path] = future
+        return future
+
+    def _decode_voice(self, path: str) -> pygame.mixer.Sound:
+        return pygame.mixer.Sound(file=io.BytesIO(self.source.read_bytes(path)))
@@ -0,0 +1,233 @@
+"""
+Asset baking for Math Adventure Game
+Pre-processes source assets offline so the game does less work at runtime.
+
+Usage:
+  python bake_assets.py tiers [--format jpg|bmp|tga]
+  python bake_assets.py pack [--include-audio]
+  python bake_assets.py manifest
+  python bake_assets.py audio [--workers N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from asset_manifest import ALL_SUBLEVELS, MANIFEST_FILE, AssetManifest
+from audio_cache import BAKED_AUDIO_DIR, get_audio_file_name, hash_file
+from asset_pack import ASSET_PACK_FILE, AssetSource, get_asset_type, write_pack
+from asset_tiers import TIER_WIDTHS, BAKED_ASSETS_DIR, TIER_INDEX_FILE
+from video_pipe import extract_audio, probe_video
+
+# Source folders scanned for images (the reward GIFs in videos/REWARD are animated and played by
+# GifPlayer from the original file, so no tier of them is ever loaded)
+IMAGE_SOURCE_DIRS = ["assets/photos"]
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+# Source folders scanned for videos whose audio track is extracted
+VIDEO_SOURCE_DIRS = ["assets", "videos"]
+# Folders packed into the asset pack. Every source image is still opened at some window width,
+# so the baked tiers (and tiers.json, which points at them) stay loose files: packing both would
+# double the pack. Ship baked/ next to the pack to use the tiers
+PACK_SOURCE_DIRS = ["assets", "videos"]
+# Baked files packed as well - the manifest is small and saves the startup scan
+PACK_BAKED_FILES = [MANIFEST_FILE]
+
+
+def find_source_images():
+    """Find every source image as a path relative to the project root"""
+    images = []
+    for source_dir in IMAGE_SOURCE_DIRS:
+        for root, _, files in os.walk(source_dir):
+            for file in sorted(files):
+                if file.lower().endswith(IMAGE_EXTENSIONS):
+                    images.append(os.path.join(root, file).replace(os.sep, "/"))
+    return sorted(images)
+
+
+def has_transparency(surface: pygame.Surface) -> bool:
+    """Check if a surface uses per-pixel alpha or a colorkey"""
+    return bool(surface.get_flags() & pygame.SRCALPHA) or surface.get_colorkey() is not None
+
+
+def to_true_color(surface: pygame.Surface, transparent: bool) -> pygame.Surface:
+    """Copy a surface into a 24-bit (opaque) or 32-bit RGBA surface that smoothscale accepts"""
+    if transparent:
+        copy = pygame.Surface(surface.get_size(), pygame.SRCALPHA, 32)
+        copy.fill((0, 0, 0, 0))
+    else:
+        copy = pygame.Surface(surface.get_size(), 0, 24)
+    copy.blit(surface, (0, 0))
+    return copy
+
+
+def bake_tiers(args):
+    """Render every source image into resolution tiers and write the tier index"""
+    output_root = BAKED_ASSETS_DIR
+    index = {}
+    written = 0
+    start = time.perf_counter()
+
+    for source in find_source_images():
+        try:
+            surface = pygame.image.load(source)
+        except pygame.error as e:
+            print(f"Skipping {source}: {e}")
+            continue
+
+        source_width, source_height = surface.get_size()
+        transparent = has_transparency(surface)
+        # Transparent images stay PNG; opaque ones use the requested format
+        extension = "png" if transparent else args.format
+        surface = to_true_color(surface, transparent)
+
+        tiers = {}
+        for tier_width in TIER_WIDTHS:
+            # Never upscale - the source itself covers windows wider than it
+            if tier_width >= source_width:
+                break
+            tier_height = round(source_height * tier_width / source_width)
+            tier_surface = pygame.transform.smoothscale(surface, (tier_width, tier_height))
+
+            baked_relative = f"{tier_width}/{source.rsplit('.', 1)[0]}.{extension}"
+            baked_path = os.path.join(output_root, baked_relative)
+            os.makedirs(os.path.dirname(baked_path), exist_ok=True)
+            pygame.image.save(tier_surface, baked_path)
+            tiers[tier_width] = baked_relative
+            written += 1
+
+        index[source] = {"source_width": source_width, "tiers": tiers}
+        print(f"Baked {source} ({source_width}x{source_height}) -> {sorted(tiers) or 'source only'}")
+
+    os.makedirs(output_root, exist_ok=True)
+    with open(os.path.join(output_root, TIER_INDEX_FILE), "w", encoding="utf-8") as index_file:
+        json.dump(index, index_file, indent=1, sort_keys=True)
+
+    print()
+    print(f"Wrote {written} tier images for {len(index)} sources in {time.perf_counter() - start:.1f}s")
+
+
+def bake_pack(args):
+    """Pack every image and audio asset into a single memory-mappable file"""
+    files = []
+    skipped = 0
+    source_dirs = list(PACK_SOURCE_DIRS)
+    if args.include_audio:
+        # Otherwise the audio cache extracts each track on first play (needs ffmpeg on the target)
+        source_dirs.append(os.path.join(BAKED_ASSETS_DIR, BAKED_AUDIO_DIR))
+    for baked_file in PACK_BAKED_FILES:
+        relative_path = f"{BAKED_ASSETS_DIR}/{baked_file}"
+        if os.path.exists(relative_path):
+            files.append((relative_path, relative_path))
+    for source_dir in source_dirs:
+        for root, _, names in os.walk(source_dir):
+            for name in sorted(names):
+                relative_path = os.path.join(root, name).replace(os.sep, "/")
+                # Videos stay loose files - moviepy/ffmpeg need a real path to read them
+                if get_asset_type(relative_path) is None:
+                    skipped += 1
+                    continue
+                files.append((relative_path, relative_path))
+
+    files.sort()
+    write_pack(ASSET_PACK_FILE, files)
+    size_mb = os.path.getsize(ASSET_PACK_FILE) / (1024 * 1024)
+    print(f"Wrote {ASSET_PACK_FILE}: {len(files)} files, {size_mb:.1f} MB ({skipped} video/other files left loose)")
+
+
+def bake_manifest(args):
+    """Write the sublevel/question asset manifest so the game skips scanning at startup"""
+    # Paths are resolved relative to the project root (the current directory)
+    manifest = AssetManifest.build(ALL_SUBLEVELS, AssetSource(), lambda relative_path: relative_path)
+    os.makedirs(BAKED_ASSETS_DIR, exist_ok=True)
+    manifest_path = os.path.join(BAKED_ASSETS_DIR, MANIFEST_FILE)
+    manifest.save(manifest_path)
+
+    question_count = sum(len(questions) for questions in manifest.data['sublevels'].values())
+    print(f"Wrote {manifest_path}: {len(manifest.data['sublevels'])} sublevels, {question_count} questions")
+
+
+def find_source_videos():
+    """Find every .mp4 (videos and voice-over clips) as a path relative to the project root"""
+    videos = []
+    for source_dir in VIDEO_SOURCE_DIRS:
+        for root, _, files in os.walk(source_dir):
+            for file in sorted(files):
+                if file.lower().endswith('.mp4'):
+                    videos.append(os.path.join(root, file).replace(os.sep, "/"))
+    return sorted(videos)
+
+
+def bake_video_audio(video_path: str, output_root: str) -> bool:
+    """Extract one video's audio track unless it is already baked - returns True if a WAV was written"""
+    wav_path = os.path.join(output_root, get_audio_file_name(hash_file(video_path)))
+    if os.path.exists(wav_path):
+        return False
+    info = probe_video(video_path)
+    if info is None or not info.has_audio:
+        return False
+    if not extract_audio(video_path, wav_path):
+        return False
+    print(f"  {video_path} -> {wav_path.replace(os.sep, '/')}")
+    return True
+
+
+def bake_audio(args):
+    """Extract every video's audio track to a WAV named by the video's content hash, in parallel"""
+    output_root = os.path.join(BAKED_ASSETS_DIR, BAKED_AUDIO_DIR)
+    os.makedirs(output_root, exist_ok=True)
+    start = time.perf_counter()
+    videos = find_source_videos()
+    # Each job is an ffmpeg process, so the threads only wait on them
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        written = sum(executor.map(lambda video_path: bake_video_audio(video_path, output_root), videos))
+
+    print()
+    print(f"Wrote {written} audio tracks for {len(videos)} videos to {output_root} "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Math Adventure Game asset baking")
+    subparsers = parser.add_subparsers(dest="command")
+
+    tiers_parser = subparsers.add_parser("tiers", help="Pre-render images into resolution tiers")
+    tiers_parser.add_argument("--format", choices=["jpg", "bmp", "tga"], default="jpg",
+                              help="Format for opaque images (bmp/tga decode fastest but are much larger)")
+    tiers_parser.set_defaults(func=bake_tiers)
+
+    pack_parser = subparsers.add_parser("pack", help="Build the single-file asset pack")
+    pack_parser.add_argument("--include-audio", action="store_true",
+                             help="Also pack the video audio baked by the audio command")
+    pack_parser.set_defaults(func=bake_pack)
+
+    manifest_parser = subparsers.add_parser("manifest", help="Write the sublevel question/audio manifest")
+    manifest_parser.set_defaults(func=bake_manifest)
+
+    audio_parser = subparsers.add_parser("audio", help="Extract video audio tracks to WAV")
+    audio_parser.add_argument("--workers", type=int, default=os.cpu_count() or 2,
+                              help="ffmpeg conversions run at once")
+    audio_parser.set_defaults(func=bake_audio)
+
+    args = parser.parse_args()
+    if not hasattr(args, "func"):
+        parser.print_help()
+        sys.exit(1)
+
+    # Run from the project root so relative asset paths match resource_path
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    print("=" * 50)
+    print(f"Math Adventure Game - Bake: {args.command}")
+    print("=" * 50)
+    pygame.init()
+    args.func(args)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+Benchmarks for Math Adventure Game
+Measures rendering costs on the current machine so changes can be compared
+before and after.
+
+Usage:
+  python benchmarks.py blit [--frames N]
+  python benchmarks.py video-upload [--frames N]
+  python benchmarks.py video-reader [--frames N]
+  python benchmarks.py feedback-audio [--plays N]
+  python benchmarks.py audio-latency [--buffers 256,512,1024,2048] [--trials N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+import weakref
+
+import pygame
+
+from main import resource_path
+from asset_pack import ASSET_PACK_FILE, AssetPack, AssetSource
+from asset_cache import convert_surface, surface_size_bytes
+from audio_latency import AUDIO_LATENCY_MODES, get_mixer_settings, measure_output_latency, reinit_mixer
+from media_imports import get_numpy, get_video_file_clip
+from sound_effects import MixProbe, SoundEffects
+from video_pipe import PipeVideoReader, probe_video
+from video_playback import VIDEO_BUFFER_FRAMES, VIDEO_RESIZE_ALGORITHM, FrameUploader
+
+# Sample images: one opaque JPEG and one PNG with transparency
+BLIT_SAMPLE_IMAGES = [
+    "assets/photos/MAP OVERALL/MAP LEVEL 1.jpg",
+    "assets/photos/EXERCISES/SELECT.png",
+]
+# Sample video for frame upload timings
+VIDEO_SAMPLE = "assets/photos/FIRST PAGE/OPENING.mp4"
+# On-screen size of a 16:9 video in the default 1600x1000 window
+VIDEO_DISPLAY_SIZE = (1440, 810)
+# Answer feedback sounds
+FEEDBACK_SAMPLES = {
+    'correct': "assets/audio/BACKGROUND MUSIC/CORRECT.mp3",
+    'wrong': "assets/audio/BACKGROUND MUSIC/WRONG.mp3",
+}
+
+
+def time_blits(screen: pygame.Surface, surface: pygame.Surface, frames: int) -> float:
+    """Blit a surface to the screen repeatedly and return the average time in milliseconds"""
+    rect = surface.get_rect(center=screen.get_rect().center)
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.blit(surface, rect)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def benchmark_blit(args):
+    """Compare blitting raw loaded surfaces against display-format converted ones"""
+    screen = pygame.display.set_mode((1600, 1000))
+    print(f"Display format: {screen.get_bitsize()}-bit, {args.frames} blits per image")
+    print()
+
+    for relative_path in BLIT_SAMPLE_IMAGES:
+        path = resource_path(relative_path)
+        if not os.path.exists(path):
+            print(f"Skipping missing image: {path}")
+            continue
+
+        raw = pygame.image.load(path)
+        # Scale to roughly the on-screen size used by the game
+        raw = pygame.transform.scale(raw, (1400, int(1400 * raw.get_height() / raw.get_width())))
+        converted = convert_surface(raw)
+
+        raw_ms = time_blits(screen, raw, args.frames)
+        converted_ms = time_blits(screen, converted, args.frames)
+        speedup = raw_ms / converted_ms if converted_ms > 0 else 0.0
+
+        print(relative_path)
+        print(f"  before (raw {raw.get_bitsize()}-bit):      {raw_ms:.3f} ms/blit")
+        print(f"  after  (converted {converted.get_bitsize()}-bit): {converted_ms:.3f} ms/blit")
+        print(f"  speedup: {speedup:.1f}x")
+
+
+def upload_per_frame_allocation(frame):
+    """Previous upload path: a new surface for the frame and another for the scaled copy"""
+    np = get_numpy()
+    frame_surface = pygame.surfarray.make_surface(np.swapaxes(frame, 0, 1))
+    return frame_surface, pygame.transform.scale(frame_surface, VIDEO_DISPLAY_SIZE)
+
+
+def time_uploads(frames, upload) -> dict:
+    """Upload frames in a loop and measure time, new surface bytes and Python/numpy allocations"""
+    surface_bytes = 0
+    previous = ()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for frame in frames:
+        surfaces = upload(frame)
+        # A surface object not seen on the previous frame was allocated for this one
+        surface_bytes += sum(surface_size_bytes(surface) for surface in surfaces
+                             if not any(surface is seen for seen in previous))
+        previous = surfaces
+    elapsed = time.perf_counter() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'ms_per_frame': elapsed * 1000 / len(frames),
+        'surface_mb_per_frame': surface_bytes / len(frames) / (1024 * 1024),
+        'python_peak_kb': peak_bytes / 1024,
+    }
+
+
+def benchmark_video_upload(args):
+    """Compare allocating a surface per video frame against uploading into reused surfaces"""
+    VideoFileClip = get_video_file_clip()
+    path = resource_path(VIDEO_SAMPLE)
+    if VideoFileClip is None or get_numpy() is None or not os.path.exists(path):
+        print("Needs moviepy, numpy and the sample video: " + path)
+        return
+
+    pygame.display.set_mode((1600, 1000))
+    clip = VideoFileClip(path, audio=False)
+    frame_count = min(args.frames, int(clip.duration * clip.fps))
+    frames = [clip.get_frame(index / clip.fps) for index in range(frame_count)]
+    clip.close()
+    height, width = frames[0].shape[:2]
+    print(f"{frame_count} frames of {width}x{height} scaled to {VIDEO_DISPLAY_SIZE[0]}x{VIDEO_DISPLAY_SIZE[1]}")
+    print()
+
+    uploader = FrameUploader()
+
+    def upload_reused(frame):
+        uploader.upload(frame)
+        return uploader.surface, uploader.scale(VIDEO_DISPLAY_SIZE)
+
+    for label, upload in [("before (make_surface + scale)", upload_per_frame_allocation),
+                          ("after  (reused surfaces)", upload_reused)]:
+        result = time_uploads(frames, upload)
+        print(label)
+        print(f"  {result['ms_per_frame']:.2f} ms/frame, "
+              f"{result['surface_mb_per_frame']:.2f} MB of new surfaces/frame, "
+              f"Python/numpy peak {result['python_peak_kb']:.0f} KB")
+
+
+def time_reader(open_reader, frame_count: int) -> dict:
+    """Open a video reader and read frames in order, measuring latency, per-frame time and allocations"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    reader = open_reader()
+    frame = reader.get_frame(0)
+    open_ms = (time.perf_counter() - start) * 1000
+
+    new_frame_bytes = 0
+    # Weak references, so the id of a freed frame reused by a new array does not count as seen
+    returned = weakref.WeakValueDictionary({id(frame): frame})
+    start = time.perf_counter()
+    for index in range(1, frame_count):
+        frame = reader.get_frame(index / reader.fps)
+        if returned.get(id(frame)) is not frame:
+            # A frame array the reader has not handed out before was allocated for this frame
+            returned[id(frame)] = frame
+            new_frame_bytes += frame.nbytes
+    frame_ms = (time.perf_counter() - start) * 1000 / max(1, frame_count - 1)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    reader.close()
+    return {
+        'open_ms': open_ms,
+        'ms_per_frame': frame_ms,
+        'frame_mb_per_frame': new_frame_bytes / max(1, frame_count - 1) / (1024 * 1024),
+        'python_peak_mb': peak_bytes / (1024 * 1024),
+    }
+
+
+def benchmark_video_reader(args):
+    """Compare the ffmpeg pipe reader against moviepy VideoFileClip for sequential playback"""
+    path = resource_path(VIDEO_SAMPLE)
+    info = probe_video(path) if os.path.exists(path) else None
+    if info is None or get_numpy() is None:
+        print("Needs ffmpeg, numpy and the sample video: " + path)
+        return
+    frame_count = min(args.frames, int(info.duration * info.fps))
+    print(f"{frame_count} frames of {info.size[0]}x{info.size[1]} decoded at "
+          f"{VIDEO_DISPLAY_SIZE[0]}x{VIDEO_DISPLAY_SIZE[1]}")
+    print()
+
+    readers = [
+        ("ffmpeg pipe", lambda: PipeVideoReader(path, info, VIDEO_DISPLAY_SIZE, buffer_count=VIDEO_BUFFER_FRAMES + 3,
+                                                scale_flags=VIDEO_RESIZE_ALGORITHM)),
+    ]
+    start = time.perf_counter()
+    VideoFileClip = get_video_file_clip()
+    import_ms = (time.perf_counter() - start) * 1000
+    if VideoFileClip is not None:
+        for label, audio in [("moviepy (with audio reader)", True), ("moviepy (video only)", False)]:
+            readers.append((label, lambda audio=audio: VideoFileClip(
+                path, audio=audio, target_resolution=VIDEO_DISPLAY_SIZE, resize_algorithm=VIDEO_RESIZE_ALGORITHM)))
+
+    for label, open_reader in readers:
+        result = time_reader(open_reader, frame_count)
+        print(label)
+        print(f"  open + first frame {result['open_ms']:.0f} ms, {result['ms_per_frame']:.2f} ms/frame")
+        print(f"  {result['frame_mb_per_frame']:.2f} MB of new frame arrays/frame, "
+              f"Python/numpy peak {result['python_peak_mb']:.1f} MB")
+    if VideoFileClip is not None:
+        print()
+        print(f"moviepy import on first use: {import_ms:.0f} ms (not needed by the pipe reader)")
+
+
+def time_until_mixed(start_playback, probe: MixProbe, timeout: float = 1.0) -> float:
+    """Start playback and return the milliseconds until the mixer callback has mixed it"""
+    # Start at a random point of the mixer period, as an answer would
+    time.sleep(random.uniform(0.0, 0.05))
+    start = time.perf_counter()
+    start_playback()
+    probe.start()
+    probe.wait(timeout)
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark_feedback_audio(args):
+    """Compare loading feedback into mixer.music per answer against preloaded Sounds on a channel"""
+    if not pygame.mixer.get_init():
+        print("No audio device available")
+        return
+    source = AssetSource(resource_path(""), AssetPack.open_if_exists(resource_path(ASSET_PACK_FILE)))
+    paths = {name: resource_path(path) for name, path in FEEDBACK_SAMPLES.items()}
+    print(f"Mixer {pygame.mixer.get_init()}, {args.plays} plays per sound (time from the answer to the first")
+    print("mixer callback that mixes it; the output buffer adds the same delay to both)")
+    print()
+
+    def play_music(path):
+        packed_file = source.open(path)
+        if packed_file is None:
+            pygame.mixer.music.load(path)
+        else:
+            pygame.mixer.music.load(packed_file, os.path.basename(path))
+        pygame.mixer.music.play()
+
+    effects = SoundEffects(paths, source)
+    start = time.perf_counter()
+    effects.load()
+    load_ms = (time.perf_counter() - start) * 1000
+    probe = MixProbe()
+
+    for name, path in paths.items():
+        music_times, sound_times = [], []
+        for _ in range(args.plays):
+            pygame.mixer.music.stop()
+            music_times.append(time_until_mixed(lambda: play_music(path), probe))
+            pygame.mixer.music.stop()
+            pygame.mixer.stop()
+            sound_times.append(time_until_mixed(lambda: effects.play(name), probe))
+            pygame.mixer.stop()
+        music_times.sort()
+        sound_times.sort()
+        print(name)
+        print(f"  mixer.music load + play  median {music_times[len(music_times) // 2]:.2f} ms, "
+              f"max {music_times[-1]:.2f} ms (and the music stream is stopped)")
+        print(f"  preloaded Sound          median {sound_times[len(sound_times) // 2]:.2f} ms, "
+              f"max {sound_times[-1]:.2f} ms")
+    print()
+    print(f"One-time decode of {len(effects.sounds)} sounds: {load_ms:.1f} ms")
+    effects.shutdown()
+
+
+def benchmark_audio_latency(args):
+    """Time scheduled-to-audible audio delay for a range of mixer buffer sizes"""
+    try:
+        buffers = [int(buffer) for buffer in args.buffers.split(",")]
+        settings_list = [get_mixer_settings(args.mode, buffer) for buffer in buffers]
+    except ValueError as e:
+        print(f"Invalid --buffers: {e}")
+        return
+    print(f"{args.trials} trials per buffer size, mode '{args.mode}' (scheduled = play() called,")
+    print("mixed = first mixer callback, audible = mixed + the device buffer ahead of it;")
+    print("driver/hardware latency comes on top)")
+    print()
+    print(f"{'buffer':>14}  {'mixed median/max':>18}  {'audible median/max':>20}")
+    for settings in settings_list:
+        if not reinit_mixer(settings):
+            continue
+        result = measure_output_latency(settings, args.trials)
+        if result is None:
+            print("No audio device available")
+            return
+        print(f"{settings.buffer:>5} ({result['buffer_ms']:4.1f} ms)  "
+              f"{result['mixed_median_ms']:7.1f} / {result['mixed_max_ms']:5.1f} ms  "
+              f"{result['audible_median_ms']:9.1f} / {result['audible_max_ms']:5.1f} ms")
+    print()
+    print("Pick the smallest buffer that plays without crackling on this machine:")
+    print("  python main.py --audio-latency low   or   python main.py --audio-buffer N")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Math Adventure Game benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+
+    blit_parser = subparsers.add_parser("blit", help="Raw vs display-format converted blit cost")
+    blit_parser.add_argument("--frames", type=int, default=300, help="Blits per image")
+    blit_parser.set_defaults(func=benchmark_blit)
+
+    video_upload_parser = subparsers.add_parser("video-upload", help="Per-frame video surface allocation vs reuse")
+    video_upload_parser.add_argument("--frames", type=int, default=60, help="Video frames to upload")
+    video_upload_parser.set_defaults(func=benchmark_video_upload)
+
+    video_reader_parser = subparsers.add_parser("video-reader", help="ffmpeg pipe vs moviepy video reader")
+    video_reader_parser.add_argument("--frames", type=int, default=120, help="Video frames to read")
+    video_reader_parser.set_defaults(func=benchmark_video_reader)
+
+    feedback_audio_parser = subparsers.add_parser("feedback-audio", help="Per-answer mixer.music load vs preloaded Sound")
+    feedback_audio_parser.add_argument("--plays", type=int, default=20, help="Plays per sound")
+    feedback_audio_parser.set_defaults(func=benchmark_feedback_audio)
+
+    audio_latency_parser = subparsers.add_parser("audio-latency", help="Scheduled-to-audible delay per mixer buffer size")
+    audio_latency_parser.add_argument("--buffers", default="256,512,1024,2048", help="Buffer sizes in samples, comma separated")
+    audio_latency_parser.add_argument("--mode", choices=list(AUDIO_LATENCY_MODES), default="default",
+                                      help="Latency mode supplying the frequency and channels")
+    audio_latency_parser.add_argument("--trials", type=int, default=20, help="Plays per buffer size")
+    audio_latency_parser.set_defaults(func=benchmark_audio_latency)
+
+    args = parser.parse_args()
+    if not hasattr(args, "func"):
+        parser.print_help()
+        sys.exit(1)
+
+    print("=" * 50)
+    print(f"Math Adventure Game - Benchmark: {args.command}")
+    print("=" * 50)
+    args.func(args)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
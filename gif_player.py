@@ -0,0 +1,145 @@
+"""
+Animated GIF playback for Math Adventure Game
+pygame.image.load only returns a GIF's first frame. GifPlayer decodes every frame
+and its delay once with Pillow on a worker thread, scales the frames to the
+window, and picks the frame to show from the elapsed time. Frames are released
+when the screen showing the GIF is left.
+"""
+
+import bisect
+import struct
+import threading
+from typing import List, Optional, Tuple
+
+import pygame
+
+from asset_cache import convert_surface
+from asset_pack import AssetSource
+from media_imports import get_pil_image
+
+# Delay used for frames without one (or with an unplayably short one), like browsers do
+DEFAULT_FRAME_DELAY_MS = 100
+MIN_FRAME_DELAY_MS = 20
+
+
+def read_gif_size(path: str, source: AssetSource) -> Optional[Tuple[int, int]]:
+    """Read a GIF's logical screen size from its header - None if it is missing or not a GIF"""
+    if not source.exists(path):
+        return None
+    packed_file = source.open(path)
+    try:
+        with (packed_file if packed_file is not None else open(path, "rb")) as gif_file:
+            header = gif_file.read(10)
+    except OSError:
+        return None
+    if len(header) < 10 or not header.startswith(b"GIF"):
+        return None
+    return struct.unpack("<HH", header[6:10])
+
+
+class GifPlayer:
+    """Frames of one animated GIF scaled to a fixed size, played on a clock"""
+
+    def __init__(self, path: str, source: Optional[AssetSource] = None):
+        self.path = path
+        self.source = source or AssetSource()
+        self.source_size = read_gif_size(path, self.source)
+        self.size: Optional[Tuple[int, int]] = None
+        self.frames: List[pygame.Surface] = []
+        self.frame_ends: List[int] = []  # Cumulative end time of each frame in milliseconds
+        self.start_time = None
+        self.finished_loading = False
+        self._decoded: List[Tuple[pygame.Surface, int]] = []  # Filled by the worker thread
+        self._lock = threading.Lock()
+        self._generation = 0  # Bumped to abandon a decode still running
+
+    def load(self, size: Tuple[int, int]):
+        """Decode every frame scaled to size in the background (drops frames of another size)"""
+        self.release()
+        self.size = size
+        generation = self._generation
+        pil_image = get_pil_image()
+        if pil_image is None:
+            # No Pillow - show the first frame only
+            self._decode_first_frame(generation, size)
+        else:
+            threading.Thread(target=self._decode, args=(pil_image, generation, size),
+                             name="GifPlayer", daemon=True).start()
+
+    def get_frame(self, now_ms: int) -> Optional[pygame.Surface]:
+        """Get the frame to show at a pygame.time.get_ticks() time (None until the first frame is ready)"""
+        finished_loading = self.finished_loading
+        self._collect_frames()
+        if not self.frames:
+            return None
+        if not finished_loading or len(self.frames) == 1:
+            # Hold the first frame until every frame is ready, then start the clock
+            return self.frames[0]
+
+        if self.start_time is None:
+            self.start_time = now_ms
+        elapsed = (now_ms - self.start_time) % self.frame_ends[-1]
+        return self.frames[bisect.bisect_right(self.frame_ends, elapsed)]
+
+    def release(self):
+        """Drop every frame (a decode still running is discarded)"""
+        with self._lock:
+            self._generation += 1
+            self._decoded = []
+        self.frames = []
+        self.frame_ends = []
+        self.start_time = None
+        self.finished_loading = False
+        self.size = None
+
+    def _collect_frames(self):
+        """Convert frames handed over by the worker on the main thread"""
+        with self._lock:
+            decoded, self._decoded = self._decoded, []
+        for surface, delay in decoded:
+            self.frames.append(convert_surface(surface))
+            self.frame_ends.append((self.frame_ends[-1] if self.frame_ends else 0) + delay)
+
+    def _add_frame(self, generation: int, surface: pygame.Surface, delay: int) -> bool:
+        """Hand a frame to the main thread - returns False once the decode was abandoned"""
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._decoded.append((surface, max(delay, MIN_FRAME_DELAY_MS)))
+            return True
+
+    def _decode(self, pil_image, generation: int, size: Tuple[int, int]):
+        frame_count = 0
+        packed_file = self.source.open(self.path)
+        try:
+            with (packed_file if packed_file is not None else open(self.path, "rb")) as gif_file:
+                image = pil_image.open(gif_file)
+                for index in range(getattr(image, "n_frames", 1)):
+                    image.seek(index)
+                    delay = image.info.get("duration") or DEFAULT_FRAME_DELAY_MS
+                    # Flatten onto black (the reward screens' background) so frames blit as opaque
+                    frame = pil_image.new("RGBA", image.size, (0, 0, 0, 255))
+                    frame.alpha_composite(image.convert("RGBA"))
+                    frame = frame.convert("RGB")
+                    surface = pygame.image.frombuffer(frame.tobytes(), frame.size, "RGB")
+                    if not self._add_frame(generation, pygame.transform.scale(surface, size), delay):
+                        return
+                    frame_count += 1
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"Error decoding GIF {self.path}: {e}")
+            if frame_count == 0:
+                self._decode_first_frame(generation, size)
+                return
+        with self._lock:
+            if generation == self._generation:
+                self.finished_loading = True
+
+    def _decode_first_frame(self, generation: int, size: Tuple[int, int]):
+        try:
+            surface = pygame.transform.scale(self.source.load_image(self.path), size)
+            self._add_frame(generation, surface, DEFAULT_FRAME_DELAY_MS)
+        except pygame.error as e:
+            print(f"Error loading GIF {self.path}: {e}")
+        with self._lock:
+            if generation == self._generation:
+                self.finished_loading = True
@@ -16,14 +16,14 @@ if errorlevel 1 (
 echo Python found! Installing dependencies...
 echo.
 
-echo [0/4] Upgrading pip and setuptools...
+echo [0/5] Upgrading pip and setuptools...
 python -m pip install --upgrade pip setuptools wheel
 if errorlevel 1 (
     echo WARNING: Failed to upgrade pip/setuptools, continuing anyway...
 )
 
 echo.
-echo [1/4] Installing pygame (using pre-built wheel)...
+echo [1/5] Installing pygame (using pre-built wheel)...
 python -m pip install --only-binary :all: pygame
 if errorlevel 1 (
     echo Attempting to install pygame (may take longer if building from source)...
@@ -41,7 +41,7 @@ if errorlevel 1 (
 )
 
 echo.
-echo [2/4] Installing numpy...
+echo [2/5] Installing numpy...
 python -m pip install numpy
 if errorlevel 1 (
     echo ERROR: Failed to install numpy
@@ -50,7 +50,7 @@ if errorlevel 1 (
 )
 
 echo.
-echo [3/4] Installing moviepy for video playback...
+echo [3/5] Installing moviepy for video playback...
 python -m pip install "moviepy>=2.0.0"
 if errorlevel 1 (
     echo ERROR: Failed to install moviepy
@@ -59,12 +59,19 @@ if errorlevel 1 (
 )
 
 echo.
-echo [4/4] Verifying installation...
+echo [4/5] Verifying installation...
 python -c "import pygame; import numpy; import moviepy; print('All packages installed successfully!')"
 if errorlevel 1 (
     echo WARNING: Installation verification failed, but packages may still work.
 )
 
+echo.
+echo [5/5] Pre-converting video and voice-over audio...
+python bake_assets.py audio
+if errorlevel 1 (
+    echo WARNING: Audio pre-conversion failed, the game will convert audio on first use instead.
+)
+
 echo.
 echo ========================================
 echo Installation complete!
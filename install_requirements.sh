@@ -24,14 +24,14 @@ fi
 echo "Python found! Installing dependencies..."
 echo ""
 
-echo "[0/4] Upgrading pip and setuptools..."
+echo "[0/5] Upgrading pip and setuptools..."
 $PIP_CMD install --upgrade pip setuptools wheel
 if [ $? -ne 0 ]; then
     echo "WARNING: Failed to upgrade pip/setuptools, continuing anyway..."
 fi
 
 echo ""
-echo "[1/4] Installing pygame..."
+echo "[1/5] Installing pygame..."
 $PIP_CMD install pygame
 if [ $? -ne 0 ]; then
     echo "ERROR: Failed to install pygame"
@@ -43,7 +43,7 @@ if [ $? -ne 0 ]; then
 fi
 
 echo ""
-echo "[2/4] Installing numpy..."
+echo "[2/5] Installing numpy..."
 $PIP_CMD install numpy
 if [ $? -ne 0 ]; then
     echo "ERROR: Failed to install numpy"
@@ -51,7 +51,7 @@ if [ $? -ne 0 ]; then
 fi
 
 echo ""
-echo "[3/4] Installing moviepy for video playback..."
+echo "[3/5] Installing moviepy for video playback..."
 $PIP_CMD install "moviepy>=2.0.0"
 if [ $? -ne 0 ]; then
     echo "ERROR: Failed to install moviepy"
@@ -59,12 +59,19 @@ if [ $? -ne 0 ]; then
 fi
 
 echo ""
-echo "[4/4] Verifying installation..."
+echo "[4/5] Verifying installation..."
 $PYTHON_CMD -c "import pygame; import numpy; import moviepy; print('All packages installed successfully!')"
 if [ $? -ne 0 ]; then
     echo "WARNING: Installation verification failed, but packages may still work."
 fi
 
+echo ""
+echo "[5/5] Pre-converting video and voice-over audio..."
+$PYTHON_CMD bake_assets.py audio
+if [ $? -ne 0 ]; then
+    echo "WARNING: Audio pre-conversion failed, the game will convert audio on first use instead."
+fi
+
 echo ""
 echo "========================================"
 echo "Installation complete!"
@@ -1,14 +1,33 @@
-import pygame
+from startup_timing import startup_timer
+
+with startup_timer.measure("import pygame"):
+    import pygame
+import argparse
 import os
 import sys
+import time
+from concurrent.futures import Future
 from typing import List, Dict, Optional
 
-try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
-    print("NumPy not available. Install with: pip install numpy")
+with startup_timer.measure("import game modules"):
+    from audio_latency import AUDIO_LATENCY_MODES, get_mixer_settings, pre_init_mixer
+    from audio_manager import AudioManager
+    from audio_cache import AUDIO_CACHE_DIR, BAKED_AUDIO_DIR, AudioExtractCache
+    from asset_cache import AssetCache, LazyAsset, convert_surface
+    from asset_manifest import AssetManifest, ALL_SUBLEVELS
+    from asset_pack import AssetPack, AssetSource, ASSET_PACK_FILE
+    from asset_prefetch import AssetPrefetcher
+    from asset_tiers import AssetTiers, BAKED_ASSETS_DIR
+    from gif_player import GifPlayer
+    from pixel_cache import PixelDiskCache, PIXEL_CACHE_DIR
+    from sublevel_preload import SublevelPreloader, PRELOAD_MODES
+    from video_pipe import PipeVideoReader, get_probed_info, probe_video, request_probe
+    from video_stills import VIDEO_STILL_CACHE_DIR, VideoStillCache
+    from video_playback import (VIDEO_BUFFER_FRAMES, VIDEO_READER_POOL_SIZE, VIDEO_RESIZE_ALGORITHM, PresentationClock,
+                                VideoPlayer, VideoReaderPool)
+
+# moviepy is imported when the first video plays, not at startup
+from media_imports import get_numpy, get_video_file_clip
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -18,29 +37,46 @@ def resource_path(relative_path):
     except Exception:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
-try:
-    import moviepy
-    from moviepy import VideoFileClip
-    MOVIEPY_AVAILABLE = True
-    print("MoviePy loaded successfully")
-except ImportError as e:
-    MOVIEPY_AVAILABLE = False
-    print(f"MoviePy import error: {e}")
-    print("MoviePy not available. Install with: pip install moviepy")
-except Exception as e:
-    MOVIEPY_AVAILABLE = False
-    print(f"MoviePy error: {e}")
-    print("MoviePy not available. Install with: pip install moviepy")
-
-# Initialize Pygame
-pygame.init()
-pygame.mixer.init()
 
 # Constants
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
 
+# Memory budget for decoded images kept by the asset cache
+ASSET_CACHE_BUDGET_MB = 256
+# Memory budget for images already scaled to the current window size
+SCALED_CACHE_BUDGET_MB = 128
+# Disk budget for decoded, pre-scaled images kept between launches (0 disables the disk cache)
+PIXEL_CACHE_BUDGET_MB = 512
+# How many upcoming question images are decoded in the background
+QUESTION_PREFETCH_DEPTH = 2
+# Memory budget for decoded voice-overs (the next question's, plus recent ones for replays)
+VOICE_CACHE_BUDGET_MB = 32
+# Sublevel preload on selection: "first-ready" (start once the first question is loaded),
+# "all-ready" (wait for every question) or None to start immediately and load on demand
+SUBLEVEL_PRELOAD_MODE = "first-ready"
+SUBLEVEL_PRELOAD_WORKERS = 4
+# Decode the lazily loaded menu/map images in the background once the first frame is shown
+STARTUP_ASSET_WARMUP = True
+# Print the startup timing report (imports, setup, first frame) once the first frame is shown
+STARTUP_TIMING_REPORT = True
+# Wait this long after the last window resize before reopening a playing video at the new size
+VIDEO_REOPEN_DELAY_MS = 300
+# ffmpeg processes extracting video/voice-over audio at once (intro audio is requested as a batch)
+AUDIO_EXTRACT_WORKERS = 2
+# Video reader: "pipe" streams frames from an ffmpeg process, "moviepy" opens a VideoFileClip
+# (the pipe falls back to moviepy when ffmpeg cannot be found)
+VIDEO_READER_BACKEND = "pipe"
+# Play the MAIN MENU video again on every return to the menu (False = only the first visit plays it,
+# later visits show its cached last frame straight away)
+SECOND_PAGE_VIDEO_ON_RETURN = True
+# Audio mixer latency mode: "default" (512-sample buffer), "low" (256, snappier feedback) or "safe"
+# (2048, for machines where the smaller buffers crackle) - overridden by --audio-latency
+AUDIO_LATENCY_MODE = "default"
+# Mixer buffer size in samples replacing the mode's (a power of two), or None - overridden by --audio-buffer
+AUDIO_BUFFER_SAMPLES = None
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -50,6 +86,39 @@ BLUE = (0, 100, 200)
 GREEN = (0, 200, 100)
 RED = (200, 0, 0)
 
+def parse_audio_arguments():
+    """Read the audio latency mode from the command line - returns (mode name, mixer settings)"""
+    parser = argparse.ArgumentParser(description="Math Adventure Game")
+    parser.add_argument("--audio-latency", choices=list(AUDIO_LATENCY_MODES), default=AUDIO_LATENCY_MODE,
+                        help="Audio mixer latency mode (tune with: python benchmarks.py audio-latency)")
+    parser.add_argument("--audio-buffer", type=int, default=AUDIO_BUFFER_SAMPLES,
+                        help="Mixer buffer size in samples, a power of two (replaces the mode's)")
+    args = parser.parse_args()
+    try:
+        return args.audio_latency, get_mixer_settings(args.audio_latency, args.audio_buffer)
+    except ValueError as e:
+        parser.error(str(e))
+
+# Initialize Pygame - when run as the game, the command line is read first so the audio device
+# opens once with the final settings (modules importing this one, like benchmarks.py, get the defaults)
+default_mixer_settings = get_mixer_settings(AUDIO_LATENCY_MODE, AUDIO_BUFFER_SAMPLES)
+if __name__ == "__main__":
+    audio_latency_mode, mixer_settings = parse_audio_arguments()
+else:
+    audio_latency_mode, mixer_settings = AUDIO_LATENCY_MODE, default_mixer_settings
+with startup_timer.measure("pygame.init"):
+    pre_init_mixer(mixer_settings)
+    pygame.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        if mixer_settings == default_mixer_settings:
+            raise
+        print(f"Audio latency mode '{audio_latency_mode}' failed ({e}), using '{AUDIO_LATENCY_MODE}'")
+        audio_latency_mode, mixer_settings = AUDIO_LATENCY_MODE, default_mixer_settings
+        pre_init_mixer(mixer_settings)
+        pygame.mixer.init()
+
 class PhotoSlideshowGame:
     def __init__(self):
         # Initialize in windowed mode with resizable window - optimized for laptops
@@ -81,13 +150,57 @@ class PhotoSlideshowGame:
         self.current_photos = []
         self.photo_objects = []
         
+        # Asset pack (python bake_assets.py pack) - loose files are used when it is missing
+        self.assets = AssetSource(resource_path(""), AssetPack.open_if_exists(resource_path(ASSET_PACK_FILE)))
+        
+        # Baked resolution tiers (python bake_assets.py tiers) - falls back to source images
+        self.asset_tiers = AssetTiers(resource_path(""), resource_path(BAKED_ASSETS_DIR), self.assets)
+        self.asset_tiers.set_window_width(self.screen_width)
+        
+        # Decoded image cache shared by every image loader
+        self.asset_cache = AssetCache(ASSET_CACHE_BUDGET_MB * 1024 * 1024, source=self.assets)
+        self.asset_cache.path_resolver = self.asset_tiers.resolve
+        # Scaled copies keyed by (asset key, target size) - cleared on resize/fullscreen toggle
+        self.scaled_cache = AssetCache(SCALED_CACHE_BUDGET_MB * 1024 * 1024, "Scaled image cache")
+        # Scaled images written to disk as raw pixels, mapped back on later launches
+        self.pixel_cache = None
+        if PIXEL_CACHE_BUDGET_MB > 0:
+            self.pixel_cache = PixelDiskCache(PIXEL_CACHE_DIR, PIXEL_CACHE_BUDGET_MB * 1024 * 1024,
+                                              self.asset_cache, resource_path(""))
+        
+        # Decodes upcoming question images/voice-overs while the current question is shown
+        self.prefetcher = AssetPrefetcher(self.asset_cache)
+        # Video audio tracks extracted once per video content (python bake_assets.py audio, else in the background)
+        self.audio_cache = AudioExtractCache(AUDIO_CACHE_DIR, resource_path(os.path.join(BAKED_ASSETS_DIR, BAKED_AUDIO_DIR)),
+                                             self.assets, AUDIO_EXTRACT_WORKERS)
+        # Last frames of videos, extracted once per video content and shown when a video has ended
+        self.video_stills = VideoStillCache(VIDEO_STILL_CACHE_DIR)
+        # (extraction future, clock the track follows or None, state it plays in) until the track starts
+        self.pending_video_audio = None
+        # Decodes and scales a whole sublevel's question images in parallel when it is selected
+        self.sublevel_preloader = SublevelPreloader(self.asset_cache, self.scaled_cache, self.get_fit_size,
+                                                    SUBLEVEL_PRELOAD_WORKERS, self.pixel_cache)
+        
+        # Sublevel questions, exercise images and intro audio, resolved once
+        self.manifest = AssetManifest.load_or_build(ALL_SUBLEVELS, self.assets, resource_path)
+        
         # Splash screen
         self.splash_video = self.load_splash_video()
         self.second_page_video = self.load_second_page_video()
-        self.select_image = self.load_select_image()
-        self.exercise_level_images = self.load_exercise_level_images()
-        self.mechanics_images = self.load_mechanics_images()
-        self.map_image = self.load_map_image()
+        # Probe the menu videos' size and frame rate with ffmpeg in the background, so it is done
+        # before the first frame is shown instead of on the render thread when they start
+        for video_path in (self.splash_video, self.second_page_video):
+            if video_path:
+                request_probe(video_path)
+        # Menu and map images load the first time a state draws them (see the properties below)
+        self.lazy_assets = {
+            'select': LazyAsset(self.load_select_image),
+            'exercise': LazyAsset(self.load_exercise_level_images),
+            'mechanics': LazyAsset(self.load_mechanics_images),
+            'map': LazyAsset(self.load_map_image),
+        }
+        self.startup_warmup_done = not STARTUP_ASSET_WARMUP
+        self.first_frame_shown = False
         self.current_level_map_image = None  # Cache for level-specific map
         self.last_completed_main_level = 0  # Track which level map is currently displayed
         self.current_mechanics_index = 0
@@ -95,6 +208,13 @@ class PhotoSlideshowGame:
         # Audio placeholder
         self.audio_enabled = True
         self.current_audio = None
+        # Music that persists across screens, voice-overs that duck it, and answer feedback decoded
+        # into memory once (after the first frame) - each on its own mixer channels
+        self.audio = AudioManager({
+            'correct': resource_path("assets/audio/BACKGROUND MUSIC/CORRECT.mp3"),
+            'wrong': resource_path("assets/audio/BACKGROUND MUSIC/WRONG.mp3"),
+        }, self.assets, VOICE_CACHE_BUDGET_MB * 1024 * 1024)
+        self.last_input_time = None  # time.perf_counter() when the key press/click being handled was polled
         
         # Level system
         self.current_level_number = 0
@@ -138,15 +258,22 @@ class PhotoSlideshowGame:
         # New game intro sequence
         self.intro_image = None
         
+        # Animated reward GIF - released as soon as no screen draws it
+        self.gif_player = None
+        self.gif_player_in_use = False
+        
         # Video clips for splash and second page
-        self.splash_video_clip = None
+        # Finished videos hand their reader back to the pool, which keeps a few open for the next play
+        self.video_readers = VideoReaderPool(self.open_video_reader, VIDEO_READER_POOL_SIZE)
+        self.splash_player = VideoPlayer("Splash", self.video_readers)
         self.splash_video_playing = False
-        self.splash_video_start_time = 0
-        self.second_page_video_clip = None
+        self.second_page_player = VideoPlayer("Second page", self.video_readers)
         self.second_page_video_playing = False
-        self.second_page_video_start_time = 0
         self.second_page_video_finished = False  # Track if video has finished
-        self.second_page_last_frame = None  # Store last frame
+        self.second_page_last_frame = None  # Last frame scaled to the window, blitted once the video has ended
+        self.second_page_visited = False  # The menu was shown before (its video may be skipped on return)
+        self.drawn_state = None  # State drawn last frame, to notice when a screen is entered
+        self.last_resize_time = 0  # Playing videos are reopened at the new size once resizing settles
         
         # Interactive areas (you can adjust these coordinates based on your image)
         self.gear_area = None  # Will be set based on image dimensions
@@ -186,14 +313,52 @@ class PhotoSlideshowGame:
             print(f"Error loading second page video: {e}")
             return None
     
+    @property
+    def select_image(self) -> Optional[pygame.Surface]:
+        return self.lazy_assets['select'].get()
+    
+    @property
+    def exercise_level_images(self) -> List[pygame.Surface]:
+        return self.lazy_assets['exercise'].get()
+    
+    @property
+    def mechanics_images(self) -> List[pygame.Surface]:
+        return self.lazy_assets['mechanics'].get()
+    
+    @property
+    def map_image(self) -> Optional[pygame.Surface]:
+        return self.lazy_assets['map'].get()
+    
+    def warm_up_startup_assets(self):
+        """Queue the lazily loaded images for background decoding so their first use is cheap"""
+        paths = [self.get_select_image_path(), *self.get_mechanics_image_paths(), self.get_map_image_path()]
+        paths += [path for path in self.manifest.get_exercise_image_paths() if path]
+        for path in paths:
+            if self.assets.exists(path):
+                self.prefetcher.request_image(path)
+        if self.audio_enabled:
+            self.audio.effects.load()
+        self.startup_warmup_done = True
+    
+    def get_select_image_path(self) -> str:
+        """Get the path of the exercise select image"""
+        return resource_path("assets/photos/EXERCISES/SELECT.png")
+    
+    def get_mechanics_image_paths(self) -> List[str]:
+        """Get the paths of the mechanics pages"""
+        return [
+            resource_path("assets/photos/mechanics/WELCOME.png"),
+            resource_path("assets/photos/mechanics/MECHANICS PART 1.png"),
+            resource_path("assets/photos/mechanics/MECHANICS PART 2.png"),
+        ]
+    
     def load_select_image(self) -> Optional[pygame.Surface]:
         """Load the select image"""
-        select_path = resource_path("assets/photos/EXERCISES/SELECT.png")
+        select_path = self.get_select_image_path()
         try:
-            if os.path.exists(select_path):
-                select_image = pygame.image.load(select_path)
-                # Scale select image to fit screen while maintaining aspect ratio
-                select_image = self.scale_photo_to_fit(select_image)
+            # Scaled to fit screen while maintaining aspect ratio
+            select_image = self.load_scaled_image(select_path)
+            if select_image is not None:
                 return select_image
             else:
                 print(f"Select image not found at {select_path}")
@@ -205,17 +370,15 @@ class PhotoSlideshowGame:
     def load_exercise_level_images(self) -> List[pygame.Surface]:
         """Load the exercise level images"""
         exercise_level_images = []
-        for i in range(1, 11):  # Levels 1-10
-            level_path = resource_path(f"assets/photos/EXERCISES/EXERCISE ({i}).jpg")
+        for i, level_path in enumerate(self.manifest.get_exercise_image_paths(), start=1):  # Levels 1-10
             try:
-                if os.path.exists(level_path):
-                    level_image = pygame.image.load(level_path)
-                    # Scale level image to fit screen while maintaining aspect ratio
-                    level_image = self.scale_photo_to_fit(level_image)
+                # Scaled to fit screen while maintaining aspect ratio
+                level_image = self.load_scaled_image(level_path) if level_path else None
+                if level_image is not None:
                     exercise_level_images.append(level_image)
                     print(f"Loaded exercise level {i} image: {level_path}")
                 else:
-                    print(f"Exercise level {i} image not found at {level_path}")
+                    print(f"Exercise level {i} image not found")
                     exercise_level_images.append(None)
             except pygame.error as e:
                 print(f"Error loading exercise level {i} image: {e}")
@@ -226,18 +389,11 @@ class PhotoSlideshowGame:
     def load_mechanics_images(self) -> List[pygame.Surface]:
         """Load the mechanics images"""
         mechanics_images = []
-        mechanics_paths = [
-            resource_path("assets/photos/mechanics/WELCOME.png"),
-            resource_path("assets/photos/mechanics/MECHANICS PART 1.png"),
-            resource_path("assets/photos/mechanics/MECHANICS PART 2.png"),
-        ]
-        
-        for path in mechanics_paths:
+        for path in self.get_mechanics_image_paths():
             try:
-                if os.path.exists(path):
-                    mechanics = pygame.image.load(path)
-                    # Scale mechanics image to fit screen while maintaining aspect ratio
-                    mechanics = self.scale_photo_to_fit(mechanics)
+                # Scaled to fit screen while maintaining aspect ratio
+                mechanics = self.load_scaled_image(path)
+                if mechanics is not None:
                     mechanics_images.append(mechanics)
                     print(f"Loaded mechanics image: {path}")
                 else:
@@ -250,10 +406,10 @@ class PhotoSlideshowGame:
     def load_map_image(self) -> Optional[pygame.Surface]:
         """Load the map image - returns base map, level-specific maps loaded dynamically"""
         try:
-            map_path = resource_path("assets/photos/MAP.png")
+            map_path = self.get_map_image_path()
             
-            if os.path.exists(map_path):
-                image = pygame.image.load(map_path)
+            image = self.asset_cache.load_image(map_path)
+            if image is not None:
                 return image
             else:
                 print(f"ERROR: Map image not found at: {map_path}")
@@ -291,13 +447,21 @@ class PhotoSlideshowGame:
                 sublevels_completed += 1
         return sublevels_completed >= self.sublevels_per_level
     
+    def get_map_image_path(self) -> str:
+        """Get the path of the base map image"""
+        return resource_path("assets/photos/MAP.png")
+    
+    def get_level_map_path(self, level_number: int) -> str:
+        """Get the path of a level-specific map image"""
+        return resource_path(f"assets/photos/MAP OVERALL/MAP LEVEL {level_number}.jpg")
+    
     def load_level_map_image(self, level_number: int) -> Optional[pygame.Surface]:
         """Load level-specific map image"""
         try:
-            map_path = resource_path(f"assets/photos/MAP OVERALL/MAP LEVEL {level_number}.jpg")
+            map_path = self.get_level_map_path(level_number)
             
-            if os.path.exists(map_path):
-                image = pygame.image.load(map_path)
+            image = self.asset_cache.load_image(map_path)
+            if image is not None:
                 print(f"Loaded level map image: {map_path}")
                 return image
             else:
@@ -361,8 +525,8 @@ class PhotoSlideshowGame:
         
         for path in intro_paths:
             try:
-                if os.path.exists(path):
-                    intro = pygame.image.load(path)
+                intro = self.asset_cache.load_image(path)
+                if intro is not None:
                     # Scale intro image to fit screen while maintaining aspect ratio
                     intro = self.scale_photo_to_fit(intro)
                     intro_images.append(intro)
@@ -376,18 +540,10 @@ class PhotoSlideshowGame:
     
     def load_intro_audio_files(self) -> List[str]:
         """Load the intro audio file paths"""
-        intro_audio_files = []
-        intro_audio_paths = [
-            resource_path("assets/photos/intro/intro (1) .mp4"),
-            resource_path("assets/photos/intro/intro (2) before showing the map.mp4")
-        ]
-        
-        for path in intro_audio_paths:
-            if os.path.exists(path):
-                intro_audio_files.append(path)
-                print(f"Found intro audio: {path}")
-            else:
-                print(f"Intro audio not found at {path}")
+        # Existence was checked once when the asset manifest was built
+        intro_audio_files = self.manifest.get_intro_audio_paths()
+        for path in intro_audio_files:
+            print(f"Found intro audio: {path}")
         
         return intro_audio_files
     
@@ -396,8 +552,8 @@ class PhotoSlideshowGame:
         photo_extensions = ('.jpg', '.jpeg', '.png', '.bmp', '.gif')
         photos = []
         
-        if os.path.exists(directory):
-            for file in os.listdir(directory):
+        if self.assets.exists(directory):
+            for file in self.assets.listdir(directory):
                 if file.lower().endswith(photo_extensions):
                     photos.append(os.path.join(directory, file))
                     
@@ -413,7 +569,9 @@ class PhotoSlideshowGame:
             # Load and scale photos
             for photo_path in self.current_photos:
                 try:
-                    photo = pygame.image.load(photo_path)
+                    photo = self.asset_cache.load_image(photo_path)
+                    if photo is None:
+                        raise pygame.error(f"File not found: {photo_path}")
                     # Scale photo to fit screen while maintaining aspect ratio
                     photo = self.scale_photo_to_fit(photo)
                     self.photo_objects.append(photo)
@@ -426,9 +584,53 @@ class PhotoSlideshowGame:
             # Play level audio if available
             self.play_level_audio(level_index)
     
-    def scale_photo_to_fit(self, photo: pygame.Surface) -> pygame.Surface:
-        """Scale photo to fit screen while maintaining aspect ratio - optimized for laptops"""
-        photo_width, photo_height = photo.get_size()
+    def scale_photo_to_fit(self, photo: pygame.Surface, cache_key: Optional[str] = None) -> pygame.Surface:
+        """Scale photo to fit screen while maintaining aspect ratio - optimized for laptops
+        
+        When cache_key is given, the scaled surface is computed once per window size and reused.
+        """
+        target_size = self.get_fit_size(photo.get_size())
+        
+        if cache_key is None:
+            return pygame.transform.scale(photo, target_size)
+        
+        scaled_key = (cache_key, target_size)
+        scaled_photo = self.scaled_cache.get(scaled_key)
+        if scaled_photo is None:
+            scaled_photo = pygame.transform.scale(photo, target_size)
+            self.scaled_cache.put(scaled_key, scaled_photo)
+            if self.pixel_cache is not None:
+                # Keep the scaled pixels for the next launch (no-op for keys that are not asset paths) -
+                # hashed and written on the cache's thread, so the frame being drawn does not wait for the disk
+                self.pixel_cache.store_in_background(cache_key, photo.get_size(), scaled_photo)
+        return scaled_photo
+    
+    def load_scaled_image(self, path: str) -> Optional[pygame.Surface]:
+        """Load an image scaled to fit the window - returns None if the file does not exist.
+        
+        Uses the scaled image cache, then the pixel disk cache, and only decodes the image if neither has it.
+        """
+        if self.pixel_cache is not None and not self.asset_cache.contains(path):
+            source_size = self.pixel_cache.get_source_size(path)
+            if source_size is not None:
+                scaled_key = (path, self.get_fit_size(source_size))
+                scaled_photo = self.scaled_cache.get(scaled_key)
+                if scaled_photo is None:
+                    scaled_photo = self.pixel_cache.load(path, scaled_key[1])
+                    if scaled_photo is not None:
+                        scaled_photo = convert_surface(scaled_photo)
+                        self.scaled_cache.put(scaled_key, scaled_photo)
+                if scaled_photo is not None:
+                    return scaled_photo
+        
+        photo = self.asset_cache.load_image(path)
+        if photo is None:
+            return None
+        return self.scale_photo_to_fit(photo, path)
+    
+    def get_fit_size(self, photo_size) -> tuple:
+        """Calculate the size a photo is scaled to by scale_photo_to_fit"""
+        photo_width, photo_height = photo_size
         # Larger margins for laptop screens to accommodate larger UI elements
         screen_width = self.screen_width - max(120, self.screen_width // 10)
         screen_height = self.screen_height - max(200, self.screen_height // 5)
@@ -441,7 +643,7 @@ class PhotoSlideshowGame:
         new_width = int(photo_width * scale)
         new_height = int(photo_height * scale)
         
-        return pygame.transform.scale(photo, (new_width, new_height))
+        return (new_width, new_height)
     
     def create_placeholder_photo(self) -> pygame.Surface:
         """Create a placeholder photo when no photos are available"""
@@ -492,59 +694,40 @@ class PhotoSlideshowGame:
         """Draw the splash screen with video"""
         self.screen.fill(BLACK)
         
-        # Initialize video if not already playing
-        if not self.splash_video_playing and self.splash_video:
+        # Initialize video if not already playing - the title is shown instead until the first frame
+        # is up and the background probe has the video's size, so it opens at its display size at once
+        if (not self.splash_video_playing and self.splash_video and self.first_frame_shown
+                and request_probe(self.splash_video).done()):
             self.start_splash_video()
         
         # Display current video frame
-        if self.splash_video_clip and self.splash_video_playing:
-            current_time = (pygame.time.get_ticks() - self.splash_video_start_time) / 1000.0
+        if self.splash_video_playing and (self.splash_player.playing or self.splash_player.finished):
+            try:
+                frame_rect = self.draw_video_frame(self.splash_player)
+            except Exception as e:
+                print(f"Error displaying splash video frame: {e}")
+                frame_rect = None
+                # Fallback
+                title = self.font_large.render("Photo Slideshow Game", True, WHITE)
+                title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
+                self.screen.blit(title, title_rect)
             
-            if current_time < self.splash_video_clip.duration:
-                try:
-                    frame = self.splash_video_clip.get_frame(current_time)
-                    # Convert numpy array to pygame surface
-                    # MoviePy returns frames as (height, width, 3) RGB arrays
-                    if NUMPY_AVAILABLE:
-                        # Swap axes: (height, width, 3) -> (width, height, 3) for pygame
-                        frame = np.swapaxes(frame, 0, 1)
-                        frame_surface = pygame.surfarray.make_surface(frame)
-                    else:
-                        # Fallback: convert frame to pygame surface
-                        frame_surface = pygame.image.frombuffer(frame.tobytes(), (frame.shape[1], frame.shape[0]), "RGB")
-                    
-                    # Scale to fit screen
-                    scaled_frame = self.scale_photo_to_fit(frame_surface)
-                    frame_rect = scaled_frame.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-                    self.screen.blit(scaled_frame, frame_rect)
-                    
-                    # Set up clickable gear area (top right)
-                    gear_x = frame_rect.x + frame_rect.width * 0.85
-                    gear_y = frame_rect.y + frame_rect.height * 0.1
-                    gear_size = 60
-                    self.gear_area = pygame.Rect(gear_x, gear_y, gear_size, gear_size)
-                    
-                    # Instructions to proceed - on the video frame
-                    instruction_text = "Click anywhere to continue, or click gear for mechanics..."
-                    self.draw_footer_instruction(instruction_text, frame_rect)
-                    return  # Return early to avoid drawing instructions twice
-                except Exception as e:
-                    print(f"Error displaying splash video frame: {e}")
-                    # Fallback
-                    title = self.font_large.render("Photo Slideshow Game", True, WHITE)
-                    title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
-                    self.screen.blit(title, title_rect)
-            else:
+            if self.splash_player.finished:
                 # Video finished - automatically transition to second page
                 self.splash_video_playing = False
                 self.current_state = "second_page"
-                # Clean up splash video clip
-                if self.splash_video_clip:
-                    try:
-                        self.splash_video_clip.close()
-                    except:
-                        pass
-                    self.splash_video_clip = None
+                self.splash_player.close()
+            elif frame_rect is not None:
+                # Set up clickable gear area (top right)
+                gear_x = frame_rect.x + frame_rect.width * 0.85
+                gear_y = frame_rect.y + frame_rect.height * 0.1
+                gear_size = 60
+                self.gear_area = pygame.Rect(gear_x, gear_y, gear_size, gear_size)
+                
+                # Instructions to proceed - on the video frame
+                instruction_text = "Click anywhere to continue, or click gear for mechanics..."
+                self.draw_footer_instruction(instruction_text, frame_rect)
+                return  # Return early to avoid drawing instructions twice
         else:
             # Fallback if video not available
             title = self.font_large.render("Photo Slideshow Game", True, WHITE)
@@ -559,93 +742,47 @@ class PhotoSlideshowGame:
         """Draw the second page with video"""
         self.screen.fill(BLACK)
         
-        # Initialize video if not already playing
-        if not self.second_page_video_playing and self.second_page_video:
+        # Start the video once per visit - once it has ended the menu rests on its last frame
+        if not self.second_page_video_playing and not self.second_page_video_finished and self.second_page_video:
             self.start_second_page_video()
         
         # Track current content rect for instruction overlay
         current_content_rect = None
         
         # Display current video frame or last frame if finished
-        if self.second_page_video_clip:
-            if self.second_page_video_finished and self.second_page_last_frame:
-                # Video has finished - display stored last frame
-                scaled_frame = self.scale_photo_to_fit(self.second_page_last_frame)
-                frame_rect = scaled_frame.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-                self.screen.blit(scaled_frame, frame_rect)
+        if self.second_page_video_playing and self.second_page_player.playing:
+            try:
+                frame_rect = self.draw_video_frame(self.second_page_player)
+            except Exception as e:
+                print(f"Error displaying second page video frame: {e}")
+                frame_rect = None
+                # Fallback
+                title = self.font_large.render("MAIN MENU", True, WHITE)
+                title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+                self.screen.blit(title, title_rect)
+                self.top_right_area = None
+            
+            if self.second_page_player.finished:
+                # Video just finished - pause on its last frame
+                self.finish_second_page_video()
+            elif frame_rect is not None:
                 current_content_rect = frame_rect
                 
-                # Set up clickable top right area for mechanics
+                # Set up clickable top right area for mechanics (10% width, 20% height)
                 self.top_right_area = pygame.Rect(frame_rect.x + frame_rect.width * 0.9, frame_rect.y, frame_rect.width * 0.1, frame_rect.height * 0.2)
-            elif self.second_page_video_playing:
-                # Video is still playing
-                current_time = (pygame.time.get_ticks() - self.second_page_video_start_time) / 1000.0
+        
+        if self.second_page_video_finished:
+            last_frame = self.get_second_page_last_frame()
+            if last_frame is not None:
+                # Video has finished - display the last frame, already scaled to the window
+                frame_rect = last_frame.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+                self.screen.blit(last_frame, frame_rect)
+                current_content_rect = frame_rect
                 
-                if current_time < self.second_page_video_clip.duration:
-                    # Still playing - display current frame
-                    try:
-                        frame = self.second_page_video_clip.get_frame(current_time)
-                        # Convert numpy array to pygame surface
-                        # MoviePy returns frames as (height, width, 3) RGB arrays
-                        if NUMPY_AVAILABLE:
-                            # Swap axes: (height, width, 3) -> (width, height, 3) for pygame
-                            frame = np.swapaxes(frame, 0, 1)
-                            frame_surface = pygame.surfarray.make_surface(frame)
-                        else:
-                            # Fallback: convert frame to pygame surface
-                            frame_surface = pygame.image.frombuffer(frame.tobytes(), (frame.shape[1], frame.shape[0]), "RGB")
-                        
-                        # Scale to fit screen
-                        scaled_frame = self.scale_photo_to_fit(frame_surface)
-                        frame_rect = scaled_frame.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-                        self.screen.blit(scaled_frame, frame_rect)
-                        current_content_rect = frame_rect
-                        
-                        # Set up clickable top right area for mechanics (10% width, 20% height)
-                        self.top_right_area = pygame.Rect(frame_rect.x + frame_rect.width * 0.9, frame_rect.y, frame_rect.width * 0.1, frame_rect.height * 0.2)
-                    except Exception as e:
-                        print(f"Error displaying second page video frame: {e}")
-                        # Fallback
-                        title = self.font_large.render("MAIN MENU", True, WHITE)
-                        title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-                        self.screen.blit(title, title_rect)
-                        self.top_right_area = None
-                else:
-                    # Video just finished - capture last frame and pause
-                    if not self.second_page_video_finished:
-                        self.second_page_video_playing = False  # Pause video
-                        self.second_page_video_finished = True
-                        
-                        # Background music already playing, keep it going
-                        
-                        # Capture and store last frame
-                        try:
-                            last_frame = self.second_page_video_clip.get_frame(self.second_page_video_clip.duration - 0.1)
-                            # Convert numpy array to pygame surface
-                            if NUMPY_AVAILABLE:
-                                last_frame = np.swapaxes(last_frame, 0, 1)
-                                frame_surface = pygame.surfarray.make_surface(last_frame)
-                            else:
-                                frame_surface = pygame.image.frombuffer(last_frame.tobytes(), (last_frame.shape[1], last_frame.shape[0]), "RGB")
-                            
-                            self.second_page_last_frame = frame_surface
-                            print("Video finished, showing last frame")
-                        except Exception as e:
-                            print(f"Error capturing last frame: {e}")
-                        
-                        # Background music should already be playing since video start
-                        # Ensure it continues if it stopped
-                        if not pygame.mixer.music.get_busy():
-                            self.play_background_music()
-                    
-                    # Display stored last frame
-                    if self.second_page_last_frame:
-                        scaled_frame = self.scale_photo_to_fit(self.second_page_last_frame)
-                        frame_rect = scaled_frame.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-                        self.screen.blit(scaled_frame, frame_rect)
-                        current_content_rect = frame_rect
-                        self.top_right_area = pygame.Rect(frame_rect.x + frame_rect.width * 0.9, frame_rect.y, frame_rect.width * 0.1, frame_rect.height * 0.2)
-        else:
+                # Set up clickable top right area for mechanics
+                self.top_right_area = pygame.Rect(frame_rect.x + frame_rect.width * 0.9, frame_rect.y, frame_rect.width * 0.1, frame_rect.height * 0.2)
+        
+        if current_content_rect is None and not self.second_page_player.playing:
             # Fallback if video not available
             title = self.font_large.render("MAIN MENU", True, WHITE)
             title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
@@ -849,15 +986,17 @@ class PhotoSlideshowGame:
         map_to_display = None
         if completed_main_level > 0 and self.current_level_map_image is not None:
             map_to_display = self.current_level_map_image
+            map_key = self.get_level_map_path(self.last_completed_main_level)
         else:
             # Fallback to base map
             map_to_display = self.map_image
+            map_key = self.get_map_image_path()
             self.last_completed_main_level = 0  # Reset if using base map
         
         content_rect = None
         if map_to_display is not None:
             # Scale the map image to fit the screen while maintaining aspect ratio
-            scaled_map = self.scale_photo_to_fit(map_to_display)
+            scaled_map = self.scale_photo_to_fit(map_to_display, map_key)
             map_rect = scaled_map.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             self.screen.blit(scaled_map, map_rect)
             content_rect = map_rect
@@ -1775,6 +1914,11 @@ class PhotoSlideshowGame:
         self.current_intro_index = 0
         self.current_state = "intro"
         
+        # Convert every intro clip's audio in the background, so later images find theirs ready
+        if self.audio_enabled:
+            for audio_path in self.intro_audio_files:
+                self.convert_mp4_to_wav(audio_path)
+        
         # Play first intro audio if available
         self.play_intro_audio_for_index(0)
     
@@ -1804,50 +1948,17 @@ class PhotoSlideshowGame:
             audio_path = self.intro_audio_files[index]
             print(f"Playing intro audio {index + 1}: {audio_path}")
             
-            try:
-                # Convert MP4 to WAV for pygame compatibility
-                wav_path = self.convert_mp4_to_wav(audio_path)
-                if wav_path and os.path.exists(wav_path):
-                    pygame.mixer.music.load(wav_path)
-                    pygame.mixer.music.play()
-                    print(f"Playing converted audio: {wav_path}")
-                else:
-                    print(f"Could not convert or find audio file: {audio_path}")
-                
-            except pygame.error as e:
-                print(f"Error playing audio {audio_path}: {e}")
+            # Convert MP4 to WAV for pygame compatibility - the intro state keeps running while
+            # the conversion finishes, and the voice-over starts (over the ducked music) once it is ready
+            self.pending_video_audio = (self.convert_mp4_to_wav(audio_path), None, self.current_state, True)
     
-    def convert_mp4_to_wav(self, mp4_path: str) -> str:
-        """Convert MP4 to WAV for pygame compatibility"""
-        try:
-            # Create WAV filename
-            wav_path = mp4_path.replace('.mp4', '.wav')
-            
-            # Check if WAV already exists
-            if os.path.exists(wav_path):
-                return wav_path
-            
-            # Try to convert using ffmpeg (if available)
-            import subprocess
-            cmd = [
-                'ffmpeg', '-i', mp4_path, '-vn', '-acodec', 'pcm_s16le', 
-                '-ar', '44100', '-ac', '2', wav_path, '-y'
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0 and os.path.exists(wav_path):
-                print(f"Converted {mp4_path} to {wav_path}")
-                return wav_path
-            else:
-                print(f"FFmpeg conversion failed: {result.stderr}")
-                return None
-                
-        except FileNotFoundError:
-            print("FFmpeg not found. Please install FFmpeg to convert MP4 audio.")
-            return None
-        except Exception as e:
-            print(f"Error converting MP4 to WAV: {e}")
-            return None
+    def convert_mp4_to_wav(self, mp4_path: str) -> Future:
+        """Convert MP4 audio to WAV for pygame compatibility on the audio worker pool
+        
+        Returns a future of the WAV path (None if the file has no audio or ffmpeg failed).
+        Converted files are kept in the audio cache, so each MP4 is converted once.
+        """
+        return self.audio_cache.request(mp4_path)
     
     def start_map_video(self):
         """Start the map video"""
@@ -1855,47 +1966,11 @@ class PhotoSlideshowGame:
         self.map_video_playing = True
         self.map_video_start_time = pygame.time.get_ticks()
         
-        # Load video with MoviePy if available
-        if MOVIEPY_AVAILABLE and os.path.exists(self.map_video_path):
-            try:
-                self.map_video_clip = VideoFileClip(self.map_video_path)
-                print(f"Loaded video: {self.map_video_path}")
-                
-                # Play the video with its audio using MoviePy
-                if self.map_video_clip.audio is not None:
-                    # Create a temporary audio file and play it
-                    temp_audio_path = "temp_map_audio.wav"
-                    # MoviePy 2.x no longer supports the 'verbose' argument on write_audiofile
-                    # Use default logging behavior instead
-                    self.map_video_clip.audio.write_audiofile(temp_audio_path, logger=None)
-                    
-                    # Play the audio with pygame
-                    pygame.mixer.music.load(temp_audio_path)
-                    pygame.mixer.music.play()
-                    print("Playing video with audio")
-                else:
-                    print("No audio track in video")
-            except Exception as e:
-                print(f"Error loading video: {e}")
-                self.map_video_clip = None
-        else:
-            self.map_video_clip = None
-            if not MOVIEPY_AVAILABLE:
-                print("MoviePy not available. Install with: pip install moviepy")
-        
-        # Fallback: try pygame audio if MoviePy failed
-        if self.map_video_clip is None:
-            self.play_map_video()
-    
-    def play_map_video(self):
-        """Play the map video audio"""
-        if self.audio_enabled and os.path.exists(self.map_video_path):
-            try:
-                # Play MP4 audio directly
-                pygame.mixer.music.load(self.map_video_path)
-                pygame.mixer.music.play()
-            except pygame.error as e:
-                print(f"Error playing map video audio: {e}")
+        # The map screen shows the map image, so only the video's audio is needed - it is
+        # extracted in the background (or taken from the audio cache) and starts once ready
+        # (pygame cannot decode MP4 audio itself, so without ffmpeg the map screen stays silent)
+        if os.path.exists(self.map_video_path):
+            self.play_video_audio(self.map_video_path)
     
     def start_splash_video(self):
         """Start the splash video"""
@@ -1903,27 +1978,14 @@ class PhotoSlideshowGame:
             return
         
         self.splash_video_playing = True
-        self.splash_video_start_time = pygame.time.get_ticks()
         
-        # Load video with MoviePy if available
-        if MOVIEPY_AVAILABLE and os.path.exists(self.splash_video):
-            try:
-                self.splash_video_clip = VideoFileClip(self.splash_video)
-                print(f"Loaded splash video: {self.splash_video}")
-                
-                # Play audio if available
-                if self.splash_video_clip.audio is not None:
-                    temp_audio_path = "temp_splash_audio.wav"
-                    # MoviePy 2.x no longer supports the 'verbose' argument on write_audiofile
-                    self.splash_video_clip.audio.write_audiofile(temp_audio_path, logger=None)
-                    pygame.mixer.music.load(temp_audio_path)
-                    pygame.mixer.music.play()
-                    print("Playing splash video with audio")
-            except Exception as e:
-                print(f"Error loading splash video: {e}")
-                self.splash_video_clip = None
-        else:
-            self.splash_video_clip = None
+        # Load video with the configured reader if available
+        if os.path.exists(self.splash_video) and self.splash_player.open(
+                self.splash_video, self.get_video_decode_size(self.splash_video)):
+            print(f"Loaded splash video: {self.splash_video}")
+            
+            # Audio is extracted in the background and joins the clock where it is once ready
+            self.play_video_audio(self.splash_video, self.splash_player.clock)
     
     def start_second_page_video(self):
         """Start the second page video"""
@@ -1932,25 +1994,159 @@ class PhotoSlideshowGame:
         
         self.second_page_video_playing = True
         self.second_page_video_finished = False  # Reset finished flag
-        self.second_page_last_frame = None  # Clear last frame
-        self.second_page_video_start_time = pygame.time.get_ticks()
         
-        # Stop any current music and start background music instead
-        pygame.mixer.music.stop()
+        # Replace any other audio with the background music (kept going if it is already playing)
         self.play_background_music()
         
-        # Load video with MoviePy if available
-        if MOVIEPY_AVAILABLE and os.path.exists(self.second_page_video):
-            try:
-                self.second_page_video_clip = VideoFileClip(self.second_page_video)
+        # Load video with the configured reader if available
+        self.second_page_player.close()
+        if os.path.exists(self.second_page_video):
+            # Extract the last frame in the background while the video plays (stored, so only once per video)
+            self.video_stills.request_last_frame(self.second_page_video)
+            # Audio is muted, so the reader is video only
+            if self.second_page_player.open(self.second_page_video, self.get_video_decode_size(self.second_page_video)):
                 print(f"Loaded second page video: {self.second_page_video}")
                 # Video audio is muted - background music plays instead
                 print("Second page video audio muted, playing background music instead")
-            except Exception as e:
-                print(f"Error loading second page video: {e}")
-                self.second_page_video_clip = None
+    
+    def enter_second_page(self):
+        """Set up the MAIN MENU video when the menu is entered"""
+        # The splash is over once the menu shows - hand its reader back
+        self.splash_player.close()
+        self.second_page_player.close()
+        if self.second_page_visited and not SECOND_PAGE_VIDEO_ON_RETURN and self.second_page_video:
+            # Seen before - show the video's last frame straight away, with the background music
+            self.second_page_video_playing = False
+            self.second_page_video_finished = True
+            self.play_background_music()
         else:
-            self.second_page_video_clip = None
+            # Played from the start by draw_second_page
+            self.second_page_video_playing = False
+            self.second_page_video_finished = False
+        self.second_page_visited = True
+    
+    def finish_second_page_video(self):
+        """Pause the second page video on its last frame once it has played to the end"""
+        self.second_page_video_playing = False
+        self.second_page_video_finished = True
+        
+        # Until the stored still is extracted, show the frame the player holds (no seek back into the video needed)
+        held_frame = self.second_page_player.frame_surface
+        if (self.second_page_last_frame is None and held_frame is not None
+                and self.video_stills.get_last_frame(self.second_page_video) is None):
+            self.second_page_last_frame = self.scale_photo_to_fit(held_frame)
+        print("Video finished, showing last frame")
+        self.second_page_player.close()
+        
+        # Background music should already be playing since video start
+        # Ensure it continues if it stopped
+        self.play_background_music()
+    
+    def get_second_page_last_frame(self) -> Optional[pygame.Surface]:
+        """Get the second page video's last frame scaled to the window (None until it is available)
+        
+        The stored still is loaded and scaled once, then blitted as is until the window size changes.
+        """
+        if self.second_page_last_frame is None and self.second_page_video:
+            still_path = self.video_stills.get_last_frame(self.second_page_video)
+            if still_path is not None:
+                try:
+                    self.second_page_last_frame = self.scale_photo_to_fit(convert_surface(pygame.image.load(still_path)))
+                except pygame.error as e:
+                    print(f"Error loading last frame {still_path}: {e}")
+        return self.second_page_last_frame
+    
+    def get_video_decode_size(self, path: str) -> Optional[tuple]:
+        """Size a video is decoded at - its on-screen size, or None for native frames
+        
+        Native until the background probe of the video has finished - never runs ffmpeg itself.
+        """
+        info = get_probed_info(path)
+        if info is None:
+            request_probe(path)
+            return None
+        display_size = self.get_fit_size(info.size)
+        if display_size[0] >= info.size[0]:
+            # Larger windows get native frames - upscaling in ffmpeg would only add decode bandwidth
+            return None
+        return display_size
+    
+    def open_video_reader(self, path: str, decode_size: Optional[tuple]):
+        """Open a video's frames at a decode size (None = native) for VideoDecoder - None if no reader is available
+        
+        Uses an ffmpeg pipe reader unless VIDEO_READER_BACKEND is "moviepy" or ffmpeg cannot be
+        found, then a moviepy VideoFileClip. Audio comes from the audio cache, not the reader.
+        """
+        # Joins the probe started at startup (normally finished by now) rather than running a second one
+        info = probe_video(path) if VIDEO_READER_BACKEND == "pipe" else None
+        if info is not None and get_numpy() is not None:
+            # Enough buffers for every queued frame plus the one being shown and the one being read
+            return PipeVideoReader(path, info, decode_size, buffer_count=VIDEO_BUFFER_FRAMES + 3,
+                                   scale_flags=VIDEO_RESIZE_ALGORITHM)
+        
+        VideoFileClip = get_video_file_clip()
+        if VideoFileClip is None:
+            return None
+        options = {'audio': False}
+        if decode_size is not None:
+            options.update(target_resolution=decode_size, resize_algorithm=VIDEO_RESIZE_ALGORITHM)
+        return VideoFileClip(path, **options)
+    
+    def play_video_audio(self, video_path: str, clock: Optional[PresentationClock] = None):
+        """Play a video's audio track on the music bus once it is extracted, from the clock's current time if one is given"""
+        self.pending_video_audio = (self.audio_cache.request(video_path), clock, self.current_state, False)
+    
+    def update_video_audio(self):
+        """Start a pending video audio track once it is ready - call once per frame"""
+        if self.pending_video_audio is None:
+            return
+        future, clock, state, voice = self.pending_video_audio
+        if self.current_state != state:
+            # The video's screen was left before its audio was ready
+            self.pending_video_audio = None
+            return
+        if not future.done() or (clock is not None and not clock.running):
+            return
+        
+        self.pending_video_audio = None
+        try:
+            wav_path = future.result()
+        except Exception as e:
+            print(f"Error extracting video audio: {e}")
+            return
+        if wav_path is None:
+            print("No audio track in video")
+            return
+        if voice:
+            self.audio.play_voice(wav_path)
+            return
+        try:
+            # Join the video where it is - nothing waited for the extraction
+            start = clock.time(pygame.time.get_ticks()) if clock is not None else 0.0
+            self.audio.play_music(wav_path, loops=0, start=start)
+            print(f"Playing video audio: {wav_path}")
+        except pygame.error as e:
+            print(f"Error playing video audio: {e}")
+    
+    def draw_video_frame(self, player: VideoPlayer) -> Optional[pygame.Rect]:
+        """Advance a video player and draw its frame centered, scaled to fit - returns the frame rect
+        
+        Returns None while the first frame is still being decoded.
+        """
+        if player.playing and pygame.time.get_ticks() - self.last_resize_time >= VIDEO_REOPEN_DELAY_MS:
+            # Once resizing settles, continue at the new window's decode size (no-op if it is unchanged)
+            player.reopen_at_size(self.get_video_decode_size(player.path))
+        
+        # Take the decoded frame for this time (the previous frame is held until it is ready)
+        frame_surface = player.update(pygame.time.get_ticks())
+        if frame_surface is None:
+            return None
+        
+        # Scale to fit screen (into a reused surface)
+        scaled_frame = player.uploader.scale(self.get_fit_size(frame_surface.get_size()))
+        frame_rect = scaled_frame.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+        self.screen.blit(scaled_frame, frame_rect)
+        return frame_rect
     
     def play_level_audio(self, level_index: int):
         """Play level audio (placeholder)"""
@@ -1976,6 +2172,10 @@ class PhotoSlideshowGame:
         # Update screen dimensions
         self.screen_width, self.screen_height = self.screen.get_size()
         
+        # Scaled images were sized for the previous window
+        self.scaled_cache.clear()
+        self.refresh_loaded_images()
+        
         # Recalculate font sizes - optimized for laptops
         base_font_size = max(24, min(self.screen_width, self.screen_height) // 30)
         self.font_large = pygame.font.Font(None, int(base_font_size * 1.8))
@@ -1995,19 +2195,72 @@ class PhotoSlideshowGame:
         
         if self.level_questions:
             self.total_questions = len(self.level_questions)
-            self.current_state = "level_question"
-            # Play audio for first question if available
-            self.play_question_audio()
+            # Decode the first voice-over while the question images load
+            first_audio = self.level_questions[0]['audio_path']
+            if first_audio and "BACKGROUND MUSIC" not in first_audio:
+                self.audio.prefetch_voice(first_audio)
+            if SUBLEVEL_PRELOAD_MODE in PRELOAD_MODES:
+                # Load the question images in the background while a loading screen is shown
+                self.sublevel_preloader.start([question['image_path'] for question in self.level_questions])
+                if not self.sublevel_preloader.is_ready(SUBLEVEL_PRELOAD_MODE):
+                    self.current_state = "level_loading"
+                    return
+            self.begin_level_questions()
         else:
             print(f"No questions found for sublevel {sublevel_string}")
     
+    def begin_level_questions(self):
+        """Show the first question of the loaded sublevel"""
+        self.current_state = "level_question"
+        # Play audio for first question if available
+        self.play_question_audio()
+    
+    def update_level_loading(self):
+        """Start the sublevel once enough question images are preloaded"""
+        if self.sublevel_preloader.is_ready(SUBLEVEL_PRELOAD_MODE):
+            self.begin_level_questions()
+    
+    def draw_level_loading(self):
+        """Draw the loading indicator shown while a sublevel's images are preloaded"""
+        self.screen.fill(BLACK)
+        
+        title_surface = self.font_large.render(f"Loading Level {self.current_level_number}", True, WHITE)
+        title_rect = title_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 60))
+        self.screen.blit(title_surface, title_rect)
+        
+        # Progress bar filled by the number of question images loaded so far
+        loaded, total = self.sublevel_preloader.get_progress()
+        bar_width = min(self.screen_width * 0.5, 600)
+        bar_height = max(15, self.screen_height // 50)
+        bar_x = (self.screen_width - bar_width) // 2
+        bar_y = self.screen_height // 2
+        pygame.draw.rect(self.screen, WHITE, pygame.Rect(bar_x, bar_y, bar_width, bar_height), 2)
+        if total > 0 and loaded > 0:
+            pygame.draw.rect(self.screen, GREEN, pygame.Rect(bar_x, bar_y, int(bar_width * loaded / total), bar_height))
+        
+        # Animated dots so the screen visibly stays responsive
+        dots = "." * (pygame.time.get_ticks() // 400 % 4)
+        status_surface = self.font_small.render(f"{loaded}/{total} images{dots}", True, LIGHT_GRAY)
+        status_rect = status_surface.get_rect(center=(self.screen_width // 2, bar_y + bar_height + 30))
+        self.screen.blit(status_surface, status_rect)
+        
+        self.draw_footer_instruction("Please wait, ESC to go back")
+    
+    def handle_level_loading_input(self, event):
+        """Handle input while a sublevel is loading"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F11:
+                self.toggle_fullscreen()
+            elif event.key == pygame.K_ESCAPE:
+                # Cancel the preload and go back to sublevel selection (or the map)
+                self.sublevel_preloader.cancel()
+                self.current_state = "sublevel_selection" if self.selected_main_level else "map_image"
+        return True
+    
     def load_level_questions(self, sublevel_string):
         """Load questions for a specific sublevel (format: "1.1", "1.2", "1.3", etc.)"""
         self.level_questions = []
         
-        # Template structure for level questions
-        level_path = resource_path(f"assets/photos/LEVEL {sublevel_string}")
-        
         # Define answers for Level 1 sublevels based on file names
         level_1_answers = {
             '1.1': {
@@ -2039,67 +2292,22 @@ class PhotoSlideshowGame:
             },
         }
         
-        if os.path.exists(level_path):
-            # Load question images from the level directory
-            question_files = []
-            for file in os.listdir(level_path):
-                if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    question_files.append(file)
+        # Question images and audio were resolved once by the asset manifest - no filesystem probing here
+        manifest_questions = self.manifest.get_questions(str(sublevel_string))
+        if manifest_questions:
+            main_level = int(sublevel_string.split('.')[0])
             
-            question_files.sort()  # Sort to ensure consistent order
-            
-            for i, question_file in enumerate(question_files):
+            for i, manifest_question in enumerate(manifest_questions):
+                question_file = manifest_question['file']
                 question_data = {
-                    'image_path': os.path.join(level_path, question_file),
+                    'image_path': manifest_question['image_path'],
                     'question_number': i + 1,
                     'correct_answer': 1,  # Default correct answer (A=1, B=2, C=3, D=4)
-                    'audio_path': None,   # Will be set if audio file exists
-                    'image': None,        # Will be loaded when needed
+                    'audio_path': manifest_question['audio_path'],  # Voice over, level audio or background music
                     'is_scenario': False,
                     'needs_text_input': False
                 }
                 
-                # Look for corresponding audio file
-                # Priority: 1. VOICE OVER directory, 2. Level directory, 3. Background music
-                # Parse main level number first (needed for special cases)
-                main_level = int(sublevel_string.split('.')[0])
-                audio_file_name = question_file.rsplit('.', 1)[0] + '.mp3'  # e.g., "22.mp3", "23.mp3"
-                audio_path = None
-                
-                # First, check VOICE OVER directory
-                voice_over_path = resource_path(f"assets/audio/VOICE OVER/{audio_file_name}")
-                if os.path.exists(voice_over_path):
-                    audio_path = voice_over_path
-                    print(f"Found voice over for {question_file}: {audio_file_name}")
-                else:
-                    # Second, check level directory (for special cases like lvl 1.mp3)
-                    if question_file == '22.jpg' and main_level == 1:
-                        # Special case for 22.jpg - use lvl 1.mp3 in level directory
-                        level_audio_file = 'lvl 1.mp3'
-                        level_audio_path = os.path.join(level_path, level_audio_file)
-                        if os.path.exists(level_audio_path):
-                            audio_path = resource_path(level_audio_path)
-                            print(f"Found level audio for {question_file}: {level_audio_file}")
-                    else:
-                        # Check for audio file matching image name in level directory
-                        level_audio_file = audio_file_name
-                        level_audio_path = os.path.join(level_path, level_audio_file)
-                        if os.path.exists(level_audio_path):
-                            audio_path = resource_path(level_audio_path)
-                            print(f"Found level audio for {question_file}: {level_audio_file}")
-                
-                # If audio found, use it; otherwise fallback to background music
-                if audio_path:
-                    question_data['audio_path'] = audio_path
-                else:
-                    # Use background music as fallback if no specific audio assigned
-                    background_music_path = resource_path("assets/audio/BACKGROUND MUSIC/BACKGROUND MUSIC.mp3")
-                    if os.path.exists(background_music_path):
-                        question_data['audio_path'] = background_music_path
-                        print(f"No audio found for {question_file}, using background music")
-                    else:
-                        question_data['audio_path'] = None
-                
                 # Set correct answers based on level
                 # Apply Level 1 answers to specific sublevels (1.1, 1.2, 1.3)
                 if main_level == 1 and sublevel_string in level_1_answers:
@@ -2140,6 +2348,24 @@ class PhotoSlideshowGame:
         
         print(f"Loaded {len(self.level_questions)} questions for sublevel {sublevel_string}")
     
+    def prefetch_upcoming_questions(self):
+        """Queue the next questions' images and the next voice-over for background loading"""
+        for offset in range(1, QUESTION_PREFETCH_DEPTH + 1):
+            next_index = self.current_question_index + offset
+            if next_index >= len(self.level_questions):
+                break
+            next_image = self.level_questions[next_index]['image_path']
+            # Images still being loaded by the sublevel preload are not requested twice
+            if not self.sublevel_preloader.is_pending(next_image):
+                self.prefetcher.request_image(next_image)
+        
+        next_index = self.current_question_index + 1
+        if next_index < len(self.level_questions):
+            next_audio = self.level_questions[next_index]['audio_path']
+            # Background music streams on the music bus - only voice-overs are decoded ahead
+            if next_audio and "BACKGROUND MUSIC" not in next_audio:
+                self.audio.prefetch_voice(next_audio)
+    
     def play_question_audio(self):
         """Play audio for current question - use background music if no specific audio"""
         if (self.current_question_index < len(self.level_questions) and 
@@ -2147,20 +2373,24 @@ class PhotoSlideshowGame:
             
             audio_path = self.level_questions[self.current_question_index]['audio_path']
             try:
-                pygame.mixer.music.load(audio_path)
-                # If it's background music, loop it; otherwise play once
+                # If it's background music, keep it looping; otherwise play the voice-over over the ducked music
                 if "BACKGROUND MUSIC" in audio_path:
-                    pygame.mixer.music.play(-1)  # Loop indefinitely
+                    self.audio.stop_voice()
+                    self.audio.play_music(audio_path)
                     print(f"Playing background music for question {self.current_question_index + 1}: {audio_path}")
                 else:
-                    pygame.mixer.music.play()  # Play once
+                    self.audio.play_voice(audio_path)
                     print(f"Playing question {self.current_question_index + 1} audio: {audio_path}")
             except Exception as e:
                 print(f"Error playing question audio: {e}")
         else:
             # No audio for this question - stop any playing music
-            pygame.mixer.music.stop()
+            self.audio.stop_voice()
+            self.audio.stop_music()
             print(f"No audio for question {self.current_question_index + 1}")
+        
+        # Queued after this question's voice-over, so its decode is not waiting behind the next one
+        self.prefetch_upcoming_questions()
     
     def handle_level_question_input(self, event):
         """Handle input in level question state"""
@@ -2338,23 +2568,13 @@ class PhotoSlideshowGame:
         if not self.audio_enabled:
             return
             
-        audio_path = None
-        if reward_type == 'correct':
-            audio_path = resource_path("assets/audio/BACKGROUND MUSIC/CORRECT.mp3")
-        elif reward_type == 'wrong':
-            audio_path = resource_path("assets/audio/BACKGROUND MUSIC/WRONG.mp3")
-        elif reward_type == 'stars':
-            audio_path = resource_path("assets/audio/BACKGROUND MUSIC/CORRECT.mp3")
-        
-        if audio_path and os.path.exists(audio_path):
-            try:
-                pygame.mixer.music.load(audio_path)
-                pygame.mixer.music.play()
-                print(f"Playing reward audio: {audio_path}")
-            except Exception as e:
-                print(f"Error playing reward audio: {e}")
+        # Stars use the correct answer sound
+        effect = {'correct': 'correct', 'wrong': 'wrong', 'stars': 'correct'}.get(reward_type)
+        # Played from memory on the effects channel - the music stream keeps going
+        if effect and self.audio.effects.play(effect, self.last_input_time):
+            print(f"Playing reward audio: {effect}")
         else:
-            print(f"Reward audio not found: {audio_path}")
+            print(f"Reward audio not available: {effect}")
     
     def play_background_music(self):
         """Play background music"""
@@ -2363,11 +2583,13 @@ class PhotoSlideshowGame:
             
         background_music_path = resource_path("assets/audio/BACKGROUND MUSIC/BACKGROUND MUSIC.mp3")
         
-        if os.path.exists(background_music_path):
+        if self.assets.exists(background_music_path):
             try:
-                pygame.mixer.music.load(background_music_path)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
-                print(f"Playing background music: {background_music_path}")
+                # Voice-overs belong to the screen being left
+                self.audio.stop_voice()
+                # Loop indefinitely - kept going, not reloaded, when it is already playing
+                if self.audio.play_music(background_music_path):
+                    print(f"Playing background music: {background_music_path}")
             except Exception as e:
                 print(f"Error playing background music: {e}")
         else:
@@ -2431,18 +2653,16 @@ class PhotoSlideshowGame:
         if (self.current_question_index < len(self.level_questions)):
             question_data = self.level_questions[self.current_question_index]
             
-            # Load question image if not already loaded
-            if question_data['image'] is None:
-                try:
-                    question_data['image'] = pygame.image.load(question_data['image_path'])
-                except Exception as e:
-                    print(f"Error loading question image: {e}")
-                    question_data['image'] = None
+            # Load the scaled question image through the caches (decoded once, then reused)
+            scaled_question = None
+            try:
+                scaled_question = self.load_scaled_image(question_data['image_path'])
+            except Exception as e:
+                print(f"Error loading question image: {e}")
             
             content_rect = None
-            if question_data['image']:
-                # Scale and display question image
-                scaled_question = self.scale_photo_to_fit(question_data['image'])
+            if scaled_question:
+                # Display question image
                 question_rect = scaled_question.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
                 self.screen.blit(scaled_question, question_rect)
                 content_rect = question_rect
@@ -2525,36 +2745,25 @@ class PhotoSlideshowGame:
         elif self.reward_type == 'stars':
             reward_path = resource_path("videos/REWARD/stars.gif")
         
-        if reward_path and os.path.exists(reward_path):
+        scaled_reward = None
+        reward_loading = False
+        reward_error = None
+        if reward_path:
+            try:
+                # Current frame of the animated GIF, scaled to fit the screen while maintaining aspect ratio
+                scaled_reward = self.get_gif_frame(reward_path, self.get_reward_fit_size)
+                reward_loading = scaled_reward is None and self.gif_player.source_size is not None
+            except Exception as e:
+                reward_error = e
+        
+        if scaled_reward is not None:
             try:
-                # Try to load the GIF file
-                reward_image = pygame.image.load(reward_path)
-                
-                # Scale the image to fit the screen while maintaining aspect ratio
-                image_width, image_height = reward_image.get_size()
-                screen_ratio = self.screen_width / self.screen_height
-                image_ratio = image_width / image_height
-                
-                if image_ratio > screen_ratio:
-                    # Image is wider than screen
-                    new_width = self.screen_width
-                    new_height = int(self.screen_width / image_ratio)
-                else:
-                    # Image is taller than screen
-                    new_height = self.screen_height
-                    new_width = int(self.screen_height * image_ratio)
-                
-                # Scale the image
-                scaled_reward = pygame.transform.scale(reward_image, (new_width, new_height))
-                
                 # Center the image on screen
                 reward_rect = scaled_reward.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
                 self.screen.blit(scaled_reward, reward_rect)
                 content_rect = reward_rect
-                
-                print(f"Successfully loaded reward GIF: {reward_path}")
             except Exception as e:
-                print(f"Error loading reward GIF: {e}")
+                print(f"Error displaying reward GIF: {e}")
                 # Fallback to text
                 reward_text = self.reward_type.upper()
                 if self.reward_type == 'stars':
@@ -2564,7 +2773,7 @@ class PhotoSlideshowGame:
                 reward_rect = reward_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
                 self.screen.blit(reward_surface, reward_rect)
                 content_rect = None
-        else:
+        elif not reward_loading:
             # Fallback text if GIF not found
             reward_text = self.reward_type.upper()
             if self.reward_type == 'stars':
@@ -2575,13 +2784,46 @@ class PhotoSlideshowGame:
             self.screen.blit(reward_surface, reward_rect)
             content_rect = None
             
-            if reward_path:
-                print(f"Reward GIF not found: {reward_path}")
+            if reward_error is not None:
+                print(f"Error loading reward GIF: {reward_error}")
         
         # Instructions for navigation - on the reward image
         instruction_text = "Press SPACE or click to continue"
         self.draw_footer_instruction(instruction_text, content_rect)
     
+    def get_reward_fit_size(self, image_size) -> tuple:
+        """Calculate the size a reward GIF is scaled to - as large as the screen allows"""
+        image_width, image_height = image_size
+        screen_ratio = self.screen_width / self.screen_height
+        image_ratio = image_width / image_height
+        
+        if image_ratio > screen_ratio:
+            # Image is wider than screen
+            return (self.screen_width, int(self.screen_width / image_ratio))
+        # Image is taller than screen
+        return (int(self.screen_height * image_ratio), self.screen_height)
+    
+    def get_gif_frame(self, gif_path: str, fit_size) -> Optional[pygame.Surface]:
+        """Get the current frame of an animated GIF scaled by fit_size (None while loading or if missing)"""
+        if self.gif_player is None or self.gif_player.path != gif_path:
+            self.release_gif_player()
+            self.gif_player = GifPlayer(gif_path, self.assets)
+        self.gif_player_in_use = True
+        if self.gif_player.source_size is None:
+            return None
+        
+        # Frames are decoded once per window size
+        target_size = fit_size(self.gif_player.source_size)
+        if self.gif_player.size != target_size:
+            self.gif_player.load(target_size)
+        return self.gif_player.get_frame(pygame.time.get_ticks())
+    
+    def release_gif_player(self):
+        """Free the animated GIF's frames"""
+        if self.gif_player is not None:
+            self.gif_player.release()
+            self.gif_player = None
+    
     def draw_mission_complete(self):
         """Draw the mission complete screen"""
         self.screen.fill(BLACK)
@@ -2603,20 +2845,27 @@ class PhotoSlideshowGame:
                 # Third: MISSION COMPLETE 2.jpg
                 image_path = resource_path("assets/photos/MISSION COMPLETE & REWARDS/MISSION COMPLETE 2.jpg")
         
-        if image_path and os.path.exists(image_path):
+        scaled_image = None
+        image_loading = False
+        if image_path:
             try:
-                # Try to load the image/GIF
-                mission_image = pygame.image.load(image_path)
-                
                 # Scale the image to fit the screen while maintaining aspect ratio
-                scaled_image = self.scale_photo_to_fit(mission_image)
+                if image_path.lower().endswith('.gif'):
+                    # Animated GIF - current frame, decoded once
+                    scaled_image = self.get_gif_frame(image_path, self.get_fit_size)
+                    image_loading = scaled_image is None and self.gif_player.source_size is not None
+                else:
+                    scaled_image = self.load_scaled_image(image_path)
+            except Exception as e:
+                print(f"Error loading mission complete image: {e}")
+        
+        if scaled_image is not None:
+            try:
                 image_rect = scaled_image.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
                 self.screen.blit(scaled_image, image_rect)
                 content_rect = image_rect
-                
-                print(f"Successfully loaded mission complete image: {image_path}")
             except Exception as e:
-                print(f"Error loading mission complete image: {e}")
+                print(f"Error displaying mission complete image: {e}")
                 # Fallback to text
                 fallback_text = "Mission Complete!"
                 if self.mission_complete_type == 'level':
@@ -2631,11 +2880,11 @@ class PhotoSlideshowGame:
                 text_rect = text_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
                 self.screen.blit(text_surface, text_rect)
                 content_rect = None
+        elif image_loading:
+            content_rect = None
         else:
             # Fallback text if image not found
             fallback_text = "Mission Complete!"
-            if image_path:
-                print(f"Mission complete image not found: {image_path}")
             
             text_surface = self.font_large.render(fallback_text, True, WHITE)
             text_rect = text_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
@@ -2691,11 +2940,16 @@ class PhotoSlideshowGame:
         
         if self.map_image is not None:
             # Show map in background (dimmed)
-            scaled_map = self.scale_photo_to_fit(self.map_image)
+            map_key = self.get_map_image_path()
+            scaled_map = self.scale_photo_to_fit(self.map_image, map_key)
             map_rect = scaled_map.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            # Draw dimmed map
-            dimmed_map = scaled_map.copy()
-            dimmed_map.set_alpha(128)
+            # Draw dimmed map (dimmed copy is cached alongside the scaled map)
+            dimmed_key = (map_key + "#dimmed", scaled_map.get_size())
+            dimmed_map = self.scaled_cache.get(dimmed_key)
+            if dimmed_map is None:
+                dimmed_map = scaled_map.copy()
+                dimmed_map.set_alpha(128)
+                self.scaled_cache.put(dimmed_key, dimmed_map)
             self.screen.blit(dimmed_map, map_rect)
         else:
             # Set up top right area
@@ -2766,9 +3020,25 @@ class PhotoSlideshowGame:
     def run(self):
         """Main game loop"""
         running = True
+        first_frame_start = startup_timer.elapsed()
         
         while running:
+            # pygame events carry no timestamp - input waiting in the queue is timed from the moment
+            # the loop comes round for it, before this frame's polling and event handling
+            input_poll_time = time.perf_counter()
+            
+            # Hand background-decoded images over to the asset cache
+            self.prefetcher.poll()
+            self.sublevel_preloader.poll()
+            self.update_video_audio()
+            self.audio.update(pygame.time.get_ticks())
+            if self.current_state == "level_loading":
+                self.update_level_loading()
+            
             for event in pygame.event.get():
+                # Feedback triggered while handling this event reports its latency from the poll
+                self.last_input_time = (input_poll_time
+                                        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN) else None)
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.VIDEORESIZE:
@@ -2804,8 +3074,18 @@ class PhotoSlideshowGame:
                     running = self.handle_sublevel_selection_input(event)
                 elif self.current_state == "mission_complete":
                     running = self.handle_mission_complete_input(event)
+                elif self.current_state == "level_loading":
+                    running = self.handle_level_loading_input(event)
+            self.last_input_time = None
             
             # Draw current state
+            if self.current_state != self.drawn_state:
+                if self.drawn_state == "second_page":
+                    # Left the menu - its reader goes back to the pool instead of waiting on a full buffer
+                    self.second_page_player.close()
+                if self.current_state == "second_page":
+                    self.enter_second_page()
+                self.drawn_state = self.current_state
             if self.current_state == "splash":
                 self.draw_splash()
             elif self.current_state == "second_page":
@@ -2836,13 +3116,73 @@ class PhotoSlideshowGame:
                 self.draw_sublevel_selection()
             elif self.current_state == "mission_complete":
                 self.draw_mission_complete()
+            elif self.current_state == "level_loading":
+                self.draw_level_loading()
+            
+            # The reward screen was left - release its GIF frames
+            if self.gif_player is not None and not self.gif_player_in_use:
+                self.release_gif_player()
+            self.gif_player_in_use = False
             
             pygame.display.flip()
             self.clock.tick(FPS)
-        
+            
+            if not self.first_frame_shown:
+                self.first_frame_shown = True
+                startup_timer.record("first frame", startup_timer.elapsed() - first_frame_start)
+                if STARTUP_TIMING_REPORT:
+                    print(startup_timer.format_report())
+            
+            if not self.startup_warmup_done:
+                # The first frame is on screen - decode the remaining startup images in the background
+                self.warm_up_startup_assets()
+        
+        print(self.asset_cache.format_stats())
+        print(self.scaled_cache.format_stats())
+        if self.pixel_cache is not None:
+            print(self.pixel_cache.format_stats())
+        self.prefetcher.stop()
+        self.sublevel_preloader.shutdown()
+        print(self.audio.format_stats())
+        print(self.audio.voice_cache.format_stats())
+        print(self.audio.effects.format_stats())
+        self.audio.shutdown()
+        self.splash_player.close()
+        self.second_page_player.close()
+        self.video_readers.close_all()
+        print(self.video_readers.format_stats())
+        self.audio_cache.shutdown()
+        self.video_stills.shutdown()
+        if self.pixel_cache is not None:
+            self.pixel_cache.shutdown()
+            self.pixel_cache.save_index()
         pygame.quit()
         sys.exit()
     
+    def refresh_loaded_images(self):
+        """Refresh loaded images for the current display mode (resolution tier and pixel format)"""
+        if self.asset_tiers.set_window_width(self.screen_width):
+            # A different resolution tier covers the new window - decode images again from that tier
+            self.asset_cache.clear()
+            if self.pixel_cache is not None:
+                self.pixel_cache.reset_session_checks()
+        else:
+            self.asset_cache.convert_all()
+        
+        # Lazily loaded images are scaled to the window - load them again when next drawn
+        for lazy_asset in self.lazy_assets.values():
+            lazy_asset.reset()
+        
+        # Images scaled at load time are held outside the cache
+        if self.intro_image:
+            self.intro_image = convert_surface(self.intro_image)
+        # The video still is scaled to the window - scale it again when next drawn
+        self.second_page_last_frame = None
+        
+        # Map images are cache entries - pick up the converted copies
+        if self.current_level_map_image is not None:
+            self.current_level_map_image = self.load_level_map_image(self.last_completed_main_level)
+    
     def handle_window_resize(self, width, height):
         """Handle window resize events - optimized for laptops"""
         # Enforce minimum window size
@@ -2851,10 +3191,15 @@ class PhotoSlideshowGame:
         
         self.screen_width = width
         self.screen_height = height
+        self.last_resize_time = pygame.time.get_ticks()
         
         # Update screen size
         self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
         
+        # Scaled images were sized for the previous window
+        self.scaled_cache.clear()
+        self.refresh_loaded_images()
+        
         # Recalculate font sizes based on new screen size - optimized for laptops
         base_font_size = max(24, min(self.screen_width, self.screen_height) // 30)
         self.font_large = pygame.font.Font(None, int(base_font_size * 1.8))
@@ -2870,24 +3215,23 @@ class PhotoSlideshowGame:
         
         # Load intro image (5.png)
         intro_path = resource_path("assets/photos/intro/5.png")
-        if os.path.exists(intro_path):
-            try:
-                intro_image = pygame.image.load(intro_path)
+        try:
+            intro_image = self.asset_cache.load_image(intro_path)
+            if intro_image is not None:
                 self.intro_image = self.scale_photo_to_fit(intro_image)
                 print(f"Loaded intro image: {intro_path}")
-            except pygame.error as e:
-                print(f"Error loading intro image: {e}")
+            else:
+                print(f"Intro image not found at {intro_path}")
                 self.intro_image = None
-        else:
-            print(f"Intro image not found at {intro_path}")
+        except pygame.error as e:
+            print(f"Error loading intro image: {e}")
             self.intro_image = None
         
         # Play intro audio (intro (1).mp3)
         audio_path = resource_path("assets/audio/VOICE OVER/intro (1) .mp3")
-        if os.path.exists(audio_path):
+        if self.assets.exists(audio_path):
             try:
-                pygame.mixer.music.load(audio_path)
-                pygame.mixer.music.play()
+                self.audio.play_voice(audio_path)
                 print(f"Playing intro audio: {audio_path}")
             except Exception as e:
                 print(f"Error playing intro audio: {e}")
@@ -2921,5 +3265,8 @@ class PhotoSlideshowGame:
         return True
 
 if __name__ == "__main__":
-    game = PhotoSlideshowGame()
+    if pygame.mixer.get_init():
+        print(f"Audio mixer: {mixer_settings.describe()}, latency mode '{audio_latency_mode}'")
+    with startup_timer.measure("game setup"):
+        game = PhotoSlideshowGame()
     game.run()
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+Deferred media imports for Math Adventure Game
+moviepy (which pulls in imageio, proglog, decorator and more), numpy and Pillow are
+only needed once a video or animated GIF plays, so they are imported the first time
+a state asks for them instead of before the window opens.
+"""
+
+from types import ModuleType
+from typing import Dict, Optional
+
+from startup_timing import startup_timer
+
+# Shown once if a deferred import fails
+INSTALL_HINTS = {
+    "numpy": "NumPy not available. Install with: pip install numpy",
+    "moviepy": "MoviePy not available. Install with: pip install moviepy",
+    "PIL.Image": "Pillow not available (animated GIFs show their first frame). Install with: pip install pillow",
+}
+
+_modules: Dict[str, Optional[ModuleType]] = {}  # Module name -> module (None if unavailable)
+
+
+def import_once(module_name: str) -> Optional[ModuleType]:
+    """Import a module the first time it is needed - returns None if it cannot be imported"""
+    if module_name not in _modules:
+        try:
+            _modules[module_name] = startup_timer.timed_import(module_name)
+            label, seconds = startup_timer.timings[-1]
+            print(f"Deferred {label}: {seconds * 1000:.1f} ms")
+        except Exception as e:
+            print(f"{module_name} import error: {e}")
+            print(INSTALL_HINTS.get(module_name, f"{module_name} not available"))
+            _modules[module_name] = None
+    return _modules[module_name]
+
+
+def get_numpy() -> Optional[ModuleType]:
+    """Get numpy, importing it on first use"""
+    return import_once("numpy")
+
+
+def get_pil_image() -> Optional[ModuleType]:
+    """Get Pillow's Image module (installed with moviepy), importing it on first use"""
+    return import_once("PIL.Image")
+
+
+def get_video_file_clip() -> Optional[type]:
+    """Get moviepy's VideoFileClip class, importing moviepy on first use"""
+    moviepy = import_once("moviepy")
+    return moviepy.VideoFileClip if moviepy is not None else None
@@ -0,0 +1,313 @@
+"""
+Decoded-pixel disk cache for Math Adventure Game
+Stores images that were already decoded and scaled to fit the window as raw pixel
+files, so later launches map them with mmap and wrap them with
+pygame.image.frombuffer instead of decoding JPEG/PNG again.
+
+Entries are keyed by source content hash + target size + pixel format. Each source
+file's signature (size and modification time) is checked once per session; a
+changed signature triggers a rehash, and a changed hash drops the cached
+entries. The cache directory is capped at a byte budget with least recently used
+eviction.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from asset_cache import USER_CACHE_DIR, AssetCache
+
+PIXEL_CACHE_VERSION = 1
+PIXEL_CACHE_INDEX_FILE = "index.json"
+PIXEL_CACHE_DIR = os.path.join(USER_CACHE_DIR, "pixel_cache")
+
+
+def get_pixel_format(surface: pygame.Surface) -> str:
+    """Get the raw pixel format an image is stored in"""
+    return "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGBX"
+
+
+class PixelDiskCache:
+    """Raw pixel files of scaled images, indexed by source content hash - safe to use from worker threads"""
+
+    def __init__(self, cache_dir: str, budget_bytes: int, asset_cache: AssetCache, base_path: str = ""):
+        self.cache_dir = cache_dir
+        self.budget_bytes = budget_bytes
+        self.asset_cache = asset_cache
+        self.base_path = base_path
+        self._lock = threading.Lock()
+        # relative load path -> {"signature": str, "hash": str, "size": [w, h], "format": str}
+        self.sources: Dict[str, Dict] = {}
+        # entry file name -> {"bytes": int, "last_used": float}
+        self.entries: Dict[str, Dict] = {}
+        # source path -> relative load path, once its signature was checked this session
+        self._checked: Dict[str, Optional[str]] = {}
+        self._dirty = False
+        # Writes for render-thread callers (store_in_background), one at a time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PixelCacheWrite")
+
+        # Counters for format_stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.load_index()
+
+    def load_index(self):
+        """Load the index and delete raw files it does not know about (e.g. after a crash)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Pixel cache disabled, cannot create {self.cache_dir}: {e}")
+            self.budget_bytes = 0
+            return
+
+        index_path = os.path.join(self.cache_dir, PIXEL_CACHE_INDEX_FILE)
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, "r", encoding="utf-8") as index_file:
+                    index = json.load(index_file)
+                if index.get("version") == PIXEL_CACHE_VERSION:
+                    self.sources = index["sources"]
+                    self.entries = index["entries"]
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Error loading pixel cache index, starting empty: {e}")
+                self.sources, self.entries = {}, {}
+
+        for name in os.listdir(self.cache_dir):
+            if name != PIXEL_CACHE_INDEX_FILE and name not in self.entries:
+                self._remove_file(name)
+        for name in [name for name in self.entries if not os.path.exists(os.path.join(self.cache_dir, name))]:
+            del self.entries[name]
+
+    def save_index(self):
+        """Write the index if anything changed since it was loaded"""
+        with self._lock:
+            if not self._dirty or self.budget_bytes <= 0:
+                return
+            index = {"version": PIXEL_CACHE_VERSION, "sources": self.sources, "entries": self.entries}
+            index_path = os.path.join(self.cache_dir, PIXEL_CACHE_INDEX_FILE)
+            try:
+                with open(index_path + ".tmp", "w", encoding="utf-8") as index_file:
+                    json.dump(index, index_file)
+                os.replace(index_path + ".tmp", index_path)
+                self._dirty = False
+            except OSError as e:
+                print(f"Error saving pixel cache index: {e}")
+
+    def get_source_size(self, path: str) -> Optional[Tuple[int, int]]:
+        """Get the decoded size of a source image if the cache knows it (None = decode it)"""
+        relative_path = self._check_source(path)
+        if relative_path is None:
+            return None
+        return tuple(self.sources[relative_path]["size"])
+
+    def load(self, path: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Map a cached scaled image - the surface shares memory with the mapped file"""
+        relative_path = self._check_source(path)
+        if relative_path is None:
+            self.misses += 1
+            return None
+        with self._lock:
+            record = self.sources.get(relative_path)
+            pixel_format = record["format"] if record else None
+            name = self._entry_name(record["hash"], size, pixel_format) if record else None
+            entry = self.entries.get(name)
+            if entry is None:
+                self.misses += 1
+                return None
+            entry["last_used"] = time.time()
+            self._dirty = True
+
+        try:
+            with open(os.path.join(self.cache_dir, name), "rb") as raw_file:
+                mapped = mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ)
+            # frombuffer keeps a reference to the mapping, which closes once the surface is freed
+            surface = pygame.image.frombuffer(mapped, size, pixel_format)
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"Error reading pixel cache entry {name}: {e}")
+            with self._lock:
+                self._drop_entry(name)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return surface
+
+    def store(self, path: str, source_size: Tuple[int, int], surface: pygame.Surface):
+        """Write a scaled image for a source path (no-op if it is already cached)"""
+        job = self._prepare_store(path, source_size, surface)
+        if job is not None:
+            self._write(*job)
+
+    def store_in_background(self, path: str, source_size: Tuple[int, int], surface: pygame.Surface):
+        """Like store, but hash and write on the cache's worker thread - for callers on the render thread
+
+        Only the pixel copy happens here, so the surface can be blitted again as soon as this returns.
+        """
+        job = self._prepare_store(path, source_size, surface)
+        if job is not None:
+            self._executor.submit(self._write, *job)
+
+    def shutdown(self):
+        """Finish the write in progress and drop queued ones - call before save_index"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _prepare_store(self, path: str, source_size: Tuple[int, int], surface: pygame.Surface) -> Optional[Tuple]:
+        """Check whether a scaled image needs writing and copy its pixels - returns _write's arguments, or None"""
+        if self.budget_bytes <= 0:
+            return None
+        load_path = self.asset_cache.resolve_load_path(path)
+        if load_path is None:
+            return None
+        relative_path = self._relative(load_path)
+        pixel_format = get_pixel_format(surface)
+
+        with self._lock:
+            record = self.sources.get(relative_path)
+            # A record checked this session is current - only a new target size needs writing
+            if record is not None and self._checked.get(path) == relative_path:
+                if self._entry_name(record["hash"], surface.get_size(), pixel_format) in self.entries:
+                    return None
+                signature, content_hash = record["signature"], record["hash"]
+            else:
+                signature, content_hash = None, None
+
+        try:
+            pixels = pygame.image.tobytes(surface, pixel_format)
+        except pygame.error as e:
+            print(f"Error caching pixels for {path}: {e}")
+            return None
+        if len(pixels) > self.budget_bytes:
+            return None
+        return (path, load_path, relative_path, signature, content_hash, source_size, surface.get_size(),
+                pixel_format, pixels)
+
+    def _write(self, path: str, load_path: str, relative_path: str, signature: Optional[str],
+               content_hash: Optional[str], source_size: Tuple[int, int], size: Tuple[int, int],
+               pixel_format: str, pixels: bytes):
+        if content_hash is None:
+            try:
+                # Hash outside the lock - the source bytes are read once per new or changed file
+                signature = self._get_signature(load_path)
+                content_hash = hashlib.sha1(self.asset_cache.source.read_bytes(load_path)).hexdigest()
+            except OSError as e:
+                print(f"Error caching pixels for {path}: {e}")
+                return
+
+        name = self._entry_name(content_hash, size, pixel_format)
+        try:
+            with open(os.path.join(self.cache_dir, name), "wb") as raw_file:
+                raw_file.write(pixels)
+        except OSError as e:
+            print(f"Error writing pixel cache entry {name}: {e}")
+            return
+
+        with self._lock:
+            old_record = self.sources.get(relative_path)
+            self.sources[relative_path] = {
+                "signature": signature, "hash": content_hash, "size": list(source_size), "format": pixel_format,
+            }
+            self._checked[path] = relative_path
+            if old_record is not None and old_record["hash"] != content_hash:
+                self._drop_unreferenced(old_record["hash"])
+            self.entries[name] = {"bytes": len(pixels), "last_used": time.time()}
+            self._dirty = True
+            self._evict()
+
+    def reset_session_checks(self):
+        """Check source signatures again (after the resolution tier changed)"""
+        with self._lock:
+            self._checked.clear()
+
+    def format_stats(self) -> str:
+        """Return a one-line summary of the cache counters"""
+        total_bytes = sum(entry["bytes"] for entry in self.entries.values())
+        return (f"Pixel disk cache: {self.hits} hits, {self.misses} misses, {self.evictions} evictions, "
+                f"{len(self.entries)} entries, "
+                f"{total_bytes / (1024 * 1024):.1f}/{self.budget_bytes / (1024 * 1024):.0f} MB")
+
+    def _check_source(self, path: str) -> Optional[str]:
+        """Validate a source's record once per session - returns its relative load path, or None"""
+        with self._lock:
+            if path in self._checked:
+                return self._checked[path]
+
+        relative_path = None
+        load_path = self.asset_cache.resolve_load_path(path)
+        if load_path is not None:
+            relative_path = self._relative(load_path)
+            record = self.sources.get(relative_path)
+            if record is not None:
+                try:
+                    signature = self._get_signature(load_path)
+                    if signature != record["signature"]:
+                        # Touched or replaced - only a different content hash invalidates the entries
+                        content_hash = hashlib.sha1(self.asset_cache.source.read_bytes(load_path)).hexdigest()
+                        with self._lock:
+                            if content_hash == record["hash"]:
+                                record["signature"] = signature
+                            else:
+                                del self.sources[relative_path]
+                                self._drop_unreferenced(record["hash"])
+                                relative_path = None
+                            self._dirty = True
+                except OSError:
+                    relative_path = None
+            else:
+                relative_path = None
+
+        with self._lock:
+            self._checked[path] = relative_path
+        return relative_path
+
+    def _get_signature(self, load_path: str) -> str:
+        """Size and modification time of a loose file, or of the pack plus the entry's position"""
+        source = self.asset_cache.source
+        pack_key = source.relative(load_path)
+        if pack_key is not None and source.pack.contains(pack_key):
+            offset, length, _ = source.pack.index[pack_key]
+            pack_stat = os.stat(source.pack.pack_path)
+            return f"pack:{pack_stat.st_size}:{pack_stat.st_mtime_ns}:{offset}:{length}"
+        file_stat = os.stat(load_path)
+        return f"{file_stat.st_size}:{file_stat.st_mtime_ns}"
+
+    def _relative(self, load_path: str) -> str:
+        return os.path.relpath(load_path, self.base_path).replace(os.sep, "/")
+
+    def _entry_name(self, content_hash: str, size: Tuple[int, int], pixel_format: str) -> str:
+        return f"{content_hash}_{size[0]}x{size[1]}_{pixel_format}.raw"
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is within budget (lock held)"""
+        total_bytes = sum(entry["bytes"] for entry in self.entries.values())
+        for name in sorted(self.entries, key=lambda name: self.entries[name]["last_used"]):
+            if total_bytes <= self.budget_bytes:
+                break
+            total_bytes -= self.entries[name]["bytes"]
+            self._drop_entry(name)
+            self.evictions += 1
+
+    def _drop_unreferenced(self, content_hash: str):
+        """Remove the entries of a content hash no source refers to anymore (lock held)"""
+        if any(record["hash"] == content_hash for record in self.sources.values()):
+            return
+        for name in [name for name in self.entries if name.startswith(content_hash + "_")]:
+            self._drop_entry(name)
+
+    def _drop_entry(self, name: str):
+        self.entries.pop(name, None)
+        self._remove_file(name)
+        self._dirty = True
+
+    def _remove_file(self, name: str):
+        try:
+            os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
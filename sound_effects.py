@@ -0,0 +1,132 @@
+"""
+Sound effects for Math Adventure Game
+Answer feedback (CORRECT/WRONG) used to be loaded into pygame.mixer.music from
+disk on every answer, which decoded the MP3 again and stopped whatever music was
+streaming. SoundEffects decodes each effect once into a pygame.mixer.Sound and
+plays it on a small pool of reserved mixer channels, next to the music stream.
+
+Plays caused by a key press or click record the time from the input being polled
+to the first mixer callback that mixes the sound, so feedback latency can be
+reported. Channel.get_busy() turns true as soon as play() returns, so a
+MixProbe tells when the mixer has actually picked the sound up; the output
+buffer then adds its own length before the sound is heard.
+"""
+
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import pygame
+
+from asset_pack import AssetSource
+
+# Mixer channels reserved for sound effects (Sound.play never picks a reserved channel)
+SFX_CHANNELS = (1, 2)
+# Reserved mixer channel for the MixProbe
+MIX_PROBE_CHANNEL = 3
+# Length of the probe's silent sound in sample frames - the first callback that mixes it plays it to the end
+MIX_PROBE_FRAMES = 4
+
+
+class MixProbe:
+    """Tells when the mixer callback has run after a sound was started
+
+    start() plays a few frames of silence on a reserved channel right after the sound;
+    the callback that mixes the sound finishes the probe, so the probe's channel stops
+    being busy exactly when the sound has been mixed. The mixer must be initialized and
+    channel_id reserved.
+    """
+
+    def __init__(self, channel_id: int = MIX_PROBE_CHANNEL):
+        _, sample_format, channels = pygame.mixer.get_init()
+        self.channel = pygame.mixer.Channel(channel_id)
+        self.sound = pygame.mixer.Sound(buffer=bytes(MIX_PROBE_FRAMES * channels * (abs(sample_format) // 8)))
+
+    def start(self):
+        self.channel.play(self.sound)
+
+    def wait(self, timeout: float = 1.0) -> bool:
+        """Block until the mixer has mixed the probe - returns False on timeout"""
+        deadline = time.perf_counter() + timeout
+        while self.channel.get_busy():
+            if time.perf_counter() > deadline:
+                return False
+            time.sleep(0.0001)
+        return True
+
+
+class SoundEffects:
+    """Short sounds decoded into memory once, played on a pool of channels"""
+
+    def __init__(self, paths: Dict[str, str], source: Optional[AssetSource] = None,
+                 channel_ids: Sequence[int] = SFX_CHANNELS):
+        self.paths = paths  # Effect name -> audio file
+        self.source = source or AssetSource()
+        self.channel_ids = tuple(channel_ids)
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.loaded = False
+        self._channels: List[pygame.mixer.Channel] = []  # Least recently started first
+        self._probe: Optional[MixProbe] = None
+        # Waits for the probe after each play from input, so the render loop never does
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MixProbe")
+        self.latencies_ms: List[float] = []  # Input polled -> first mixer callback, per play caused by input
+
+    def load(self):
+        """Decode every effect (the mixer must be initialized)"""
+        if self.loaded:
+            return
+        self.loaded = True
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.set_reserved(max(*self.channel_ids, MIX_PROBE_CHANNEL) + 1)
+        self._channels = [pygame.mixer.Channel(channel_id) for channel_id in self.channel_ids]
+        self._probe = MixProbe()
+        start = time.perf_counter()
+        for name, path in self.paths.items():
+            if not self.source.exists(path):
+                print(f"Sound effect not found: {path}")
+                continue
+            try:
+                self.sounds[name] = pygame.mixer.Sound(file=io.BytesIO(self.source.read_bytes(path)))
+            except (OSError, pygame.error) as e:
+                print(f"Error loading sound effect {path}: {e}")
+        print(f"Loaded {len(self.sounds)} sound effects in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def play(self, name: str, input_time: Optional[float] = None) -> Optional[pygame.mixer.Channel]:
+        """Play an effect on a free channel (or cut off the oldest) - returns the channel, None if unavailable
+
+        input_time is the time.perf_counter() when the input that caused the play was polled, if any.
+        """
+        self.load()
+        sound = self.sounds.get(name)
+        if sound is None or not self._channels:
+            return None
+        channel = next((channel for channel in self._channels if not channel.get_busy()), self._channels[0])
+        channel.play(sound)
+        self._channels.remove(channel)
+        self._channels.append(channel)
+        if input_time is not None and self._probe is not None:
+            self._probe.start()
+            self._executor.submit(self._record_latency, name, input_time)
+        return channel
+
+    def shutdown(self):
+        """Stop the latency thread"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _record_latency(self, name: str, input_time: float):
+        if not self._probe.wait():
+            return
+        latency_ms = (time.perf_counter() - input_time) * 1000
+        self.latencies_ms.append(latency_ms)
+        print(f"Sound effect '{name}': {latency_ms:.2f} ms from input to the mixer")
+
+    def format_stats(self) -> str:
+        """Return a one-line summary of input-to-mixer latency"""
+        if not self.latencies_ms:
+            return "Sound effects: no plays from input"
+        latencies = sorted(self.latencies_ms)
+        median = latencies[len(latencies) // 2]
+        return (f"Sound effects: {len(latencies)} plays from input, input to the mixer "
+                f"median {median:.2f} ms, max {latencies[-1]:.2f} ms (plus the output buffer)")
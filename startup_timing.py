@@ -0,0 +1,53 @@
+"""
+Startup timing for Math Adventure Game
+Records how long each startup phase and import takes, so slow cold boots can be
+traced to a specific module or loader. The report is printed once the first
+frame is on screen.
+"""
+
+import importlib
+import time
+from contextlib import contextmanager
+from types import ModuleType
+from typing import List, Tuple
+
+
+class StartupTimer:
+    """Collects (label, seconds) timings from process start to the first frame"""
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.timings: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def measure(self, label: str):
+        """Time the enclosed block under a label"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(label, time.perf_counter() - start)
+
+    def record(self, label: str, seconds: float):
+        self.timings.append((label, seconds))
+
+    def timed_import(self, module_name: str) -> ModuleType:
+        """Import a module and record how long it took"""
+        with self.measure(f"import {module_name}"):
+            return importlib.import_module(module_name)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def format_report(self) -> str:
+        """Return the timings as an aligned table with the total time since start"""
+        width = max([len(label) for label, _ in self.timings] + [len("Total")])
+        lines = ["Startup timing:"]
+        for label, seconds in self.timings:
+            lines.append(f"  {label:<{width}}  {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'Total':<{width}}  {self.elapsed() * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+# Shared timer - created when the game first imports this module
+startup_timer = StartupTimer()
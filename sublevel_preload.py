@@ -0,0 +1,117 @@
+"""
+Sublevel preloading for Math Adventure Game
+Decodes and scales every question image of a sublevel in parallel on a thread
+pool when the sublevel is selected, so questions never decode on the main thread.
+Finished images are handed back to the main thread, converted to the display
+format and stored in the asset and scaled-image caches.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from asset_cache import AssetCache, convert_surface
+from pixel_cache import PixelDiskCache
+
+# "first-ready" starts the sublevel once its first question image is loaded,
+# "all-ready" waits until every question image is loaded
+PRELOAD_MODES = ("first-ready", "all-ready")
+
+
+class SublevelPreloader:
+    """Thread pool that decodes and scales a sublevel's question images"""
+
+    def __init__(self, asset_cache: AssetCache, scaled_cache: AssetCache,
+                 get_fit_size: Callable[[Tuple[int, int]], Tuple[int, int]], max_workers: int = 4,
+                 pixel_cache: Optional[PixelDiskCache] = None):
+        self.asset_cache = asset_cache
+        self.scaled_cache = scaled_cache
+        # Scaled images from earlier sessions are mapped from disk instead of decoded
+        self.pixel_cache = pixel_cache
+        # Target size for a decoded image (the game's scale_photo_to_fit size)
+        self.get_fit_size = get_fit_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="SublevelPreload")
+        self._futures: Dict[str, Future] = {}  # Image path -> decode/scale job
+        self.image_paths: List[str] = []
+        self.loaded_paths = set()
+
+    def start(self, image_paths: List[str]):
+        """Start loading a sublevel's images (cancels any preload still running)"""
+        self.cancel()
+        self.image_paths = list(image_paths)
+        for path in self.image_paths:
+            if self.asset_cache.contains(path):
+                self.loaded_paths.add(path)
+            else:
+                self._futures[path] = self._executor.submit(self._load, path)
+
+    def cancel(self):
+        """Drop the current preload - jobs that already started finish but are discarded"""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self.image_paths = []
+        self.loaded_paths = set()
+
+    def is_pending(self, path: str) -> bool:
+        return path in self._futures
+
+    def poll(self):
+        """Move finished images into the caches - call once per frame from the main thread"""
+        for path, future in list(self._futures.items()):
+            if not future.done():
+                continue
+            del self._futures[path]
+            self.loaded_paths.add(path)
+            try:
+                result = future.result()
+            except (pygame.error, OSError) as e:
+                print(f"Error preloading {path}: {e}")
+                continue
+            if result is None:
+                continue
+
+            # Display conversion must happen on the main thread
+            surface, source_size, scaled_surface = result
+            if surface is not None and not self.asset_cache.contains(path):
+                self.asset_cache.put(path, convert_surface(surface))
+            scaled_key = (path, scaled_surface.get_size())
+            # Skip the scaled copy if the window was resized while it was being made
+            if scaled_key[1] == self.get_fit_size(source_size) and not self.scaled_cache.contains(scaled_key):
+                self.scaled_cache.put(scaled_key, convert_surface(scaled_surface))
+
+    def is_ready(self, mode: str) -> bool:
+        """Check if the sublevel can start in the given preload mode"""
+        if not self.image_paths:
+            return True
+        if mode == "all-ready":
+            return not self._futures
+        return self.image_paths[0] in self.loaded_paths
+
+    def get_progress(self) -> Tuple[int, int]:
+        """Get (loaded, total) image counts for the loading indicator"""
+        return len(self.loaded_paths), len(self.image_paths)
+
+    def shutdown(self):
+        """Stop the worker threads"""
+        self.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _load(self, path: str) -> Optional[Tuple[Optional[pygame.Surface], Tuple[int, int], pygame.Surface]]:
+        """Decode and scale an image - returns (decoded or None, decoded size, scaled)"""
+        if self.pixel_cache is not None:
+            source_size = self.pixel_cache.get_source_size(path)
+            if source_size is not None:
+                scaled_surface = self.pixel_cache.load(path, self.get_fit_size(source_size))
+                if scaled_surface is not None:
+                    return None, source_size, scaled_surface
+
+        load_path = self.asset_cache.resolve_load_path(path)
+        if load_path is None:
+            return None
+        surface = self.asset_cache.source.load_image(load_path)
+        scaled_surface = pygame.transform.scale(surface, self.get_fit_size(surface.get_size()))
+        if self.pixel_cache is not None:
+            self.pixel_cache.store(path, surface.get_size(), scaled_surface)
+        return surface, surface.get_size(), scaled_surface
@@ -0,0 +1,250 @@
+"""
+ffmpeg pipe video reader for Math Adventure Game
+The menu videos are only ever played forward, so instead of a moviepy
+VideoFileClip (which imports moviepy, probes the file and opens an audio reader)
+PipeVideoReader starts one ffmpeg process that streams raw RGB frames, already
+scaled to the display size, into a small ring of preallocated frame buffers.
+It has the part of VideoFileClip's interface that VideoDecoder uses.
+"""
+
+import re
+import shutil
+import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from media_imports import get_numpy, import_once
+
+# Video reader backends: "pipe" (ffmpeg subprocess) or "moviepy" (VideoFileClip)
+VIDEO_READER_BACKENDS = ("pipe", "moviepy")
+
+# Hide the console window ffmpeg would open in a windowed Windows build
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+_DURATION_PATTERN = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+_VIDEO_STREAM_PATTERN = re.compile(r"Stream #.*: Video: .*?, (\d{2,5})x(\d{2,5})[ ,].*?(\d+(?:\.\d+)?) fps")
+_ROTATION_PATTERN = re.compile(r"(?:rotation of|rotate\s*:)\s*(-?\d+(?:\.\d+)?)")
+
+
+class VideoInfo(NamedTuple):
+    size: Tuple[int, int]  # Frame size as decoded (rotation applied)
+    fps: float
+    duration: float
+    has_audio: bool
+
+
+_ffmpeg_exe: Optional[str] = None
+_video_infos: Dict[str, Optional[VideoInfo]] = {}  # Video path -> probed info
+_probe_futures: Dict[str, Future] = {}  # Video path -> background probe (request_probe)
+_probe_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_ffmpeg_exe() -> Optional[str]:
+    """Find the ffmpeg binary - the one bundled with imageio-ffmpeg (as moviepy uses), else ffmpeg on PATH"""
+    global _ffmpeg_exe
+    if _ffmpeg_exe is None:
+        imageio_ffmpeg = import_once("imageio_ffmpeg")
+        if imageio_ffmpeg is not None:
+            try:
+                _ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+            except RuntimeError as e:
+                print(f"Bundled ffmpeg not available: {e}")
+        if _ffmpeg_exe is None:
+            _ffmpeg_exe = shutil.which("ffmpeg") or ""
+    return _ffmpeg_exe or None
+
+
+def probe_video(path: str) -> Optional[VideoInfo]:
+    """Read a video's frame size, frame rate, duration and audio presence, once per path
+
+    Runs ffmpeg, or waits for the background probe of the path if one was requested.
+    """
+    if path not in _video_infos:
+        future = _probe_futures.get(path)
+        if future is not None:
+            return future.result()
+        _video_infos[path] = _probe(path)
+    return _video_infos[path]
+
+
+def request_probe(path: str) -> Future:
+    """Probe a video on a background thread, once per path - the future's result is probe_video's"""
+    global _probe_executor
+    future = _probe_futures.get(path)
+    if future is None:
+        if path in _video_infos:
+            future = Future()
+            future.set_result(_video_infos[path])
+        else:
+            if _probe_executor is None:
+                _probe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="VideoProbe")
+            future = _probe_executor.submit(_probe_and_store, path)
+        _probe_futures[path] = future
+    return future
+
+
+def get_probed_info(path: str) -> Optional[VideoInfo]:
+    """Get a video's info without waiting - None until a probe of it has finished (or if it failed)"""
+    return _video_infos.get(path)
+
+
+def _probe_and_store(path: str) -> Optional[VideoInfo]:
+    _video_infos[path] = _probe(path)
+    return _video_infos[path]
+
+
+def _probe(path: str) -> Optional[VideoInfo]:
+    ffmpeg_exe = get_ffmpeg_exe()
+    if ffmpeg_exe is None:
+        return None
+    try:
+        # Without an output file ffmpeg only prints the input's stream info (and exits with an error)
+        result = subprocess.run([ffmpeg_exe, "-hide_banner", "-i", path], stdin=subprocess.DEVNULL,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=10,
+                                creationflags=_CREATION_FLAGS)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"Error probing video {path}: {e}")
+        return None
+
+    output = result.stderr.decode("utf-8", errors="replace")
+    duration_match = _DURATION_PATTERN.search(output)
+    stream_match = _VIDEO_STREAM_PATTERN.search(output)
+    if duration_match is None or stream_match is None:
+        print(f"Error probing video {path}: no video stream found")
+        return None
+
+    hours, minutes, seconds = duration_match.groups()
+    width, height = int(stream_match.group(1)), int(stream_match.group(2))
+    rotation_match = _ROTATION_PATTERN.search(output)
+    if rotation_match is not None and abs(round(float(rotation_match.group(1)))) in (90, 270):
+        # ffmpeg rotates phone videos upright while decoding
+        width, height = height, width
+    return VideoInfo(
+        size=(width, height),
+        fps=float(stream_match.group(3)),
+        duration=int(hours) * 3600 + int(minutes) * 60 + float(seconds),
+        has_audio=re.search(r"Stream #.*: Audio: ", output) is not None,
+    )
+
+
+def extract_audio(path: str, wav_path: str) -> bool:
+    """Write a video's audio track to a 16-bit WAV file - returns False if it failed"""
+    ffmpeg_exe = get_ffmpeg_exe()
+    if ffmpeg_exe is None:
+        return False
+    try:
+        result = subprocess.run([ffmpeg_exe, "-hide_banner", "-loglevel", "error", "-y", "-i", path,
+                                 "-vn", "-acodec", "pcm_s16le", "-ar", "44100", "-ac", "2", wav_path],
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                timeout=60, creationflags=_CREATION_FLAGS)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"Error extracting audio from {path}: {e}")
+        return False
+    if result.returncode != 0:
+        print(f"Error extracting audio from {path}: {result.stderr.decode('utf-8', errors='replace').strip()}")
+        return False
+    return True
+
+
+def extract_last_frame(path: str, image_path: str) -> bool:
+    """Write a video's final frame to an image file (format from its extension) - returns False if it failed"""
+    ffmpeg_exe = get_ffmpeg_exe()
+    if ffmpeg_exe is None:
+        return False
+    try:
+        # Decode only the last moment of the video; each frame overwrites the image, so the final one is kept
+        result = subprocess.run([ffmpeg_exe, "-hide_banner", "-loglevel", "error", "-y", "-sseof", "-0.3", "-i", path,
+                                 "-an", "-update", "1", "-q:v", "2", image_path],
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                timeout=60, creationflags=_CREATION_FLAGS)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"Error extracting last frame of {path}: {e}")
+        return False
+    if result.returncode != 0:
+        print(f"Error extracting last frame of {path}: {result.stderr.decode('utf-8', errors='replace').strip()}")
+        return False
+    return True
+
+
+class PipeVideoReader:
+    """Sequential RGB frames from an ffmpeg subprocess, read into reused buffers.
+
+    get_frame returns one of buffer_count arrays that are overwritten in turn, so a
+    frame stays valid while fewer than buffer_count newer frames have been read.
+    """
+
+    def __init__(self, path: str, info: VideoInfo, size: Optional[Tuple[int, int]] = None,
+                 buffer_count: int = 8, scale_flags: str = "fast_bilinear"):
+        self.filename = path
+        self.fps = info.fps
+        self.duration = info.duration
+        self.size = tuple(size) if size is not None else info.size
+        self.scale_flags = scale_flags
+        width, height = self.size
+        self._frame_bytes = width * height * 3
+        np = get_numpy()
+        self._buffers = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(buffer_count)]
+        self._next_buffer = 0
+        self._last_frame = None
+        self._next_index = 0  # Index of the frame the pipe delivers next
+        self._proc: Optional[subprocess.Popen] = None
+        self._open(0)
+
+    def get_frame(self, t: float):
+        """Get the frame shown at time t - reading forward is cheap, anything else restarts ffmpeg"""
+        index = int(t * self.fps + 1e-6)
+        if index == self._next_index - 1 and self._last_frame is not None:
+            return self._last_frame
+        if index < self._next_index or index > self._next_index + self.fps:
+            # Backwards or far ahead - seeking beats decoding every frame in between
+            self._open(index)
+        while self._next_index <= index:
+            if not self._read_frame():
+                break  # End of stream - keep the last frame, like VideoFileClip does
+        if self._last_frame is None:
+            raise IOError(f"No frames could be read from {self.filename}")
+        return self._last_frame
+
+    def rewind(self):
+        """Restart ffmpeg at the first frame, so the next play starts without waiting for the process"""
+        self._open(0)
+        self._last_frame = None
+
+    def close(self):
+        """Stop the ffmpeg process"""
+        if self._proc is not None:
+            self._proc.terminate()
+            try:
+                self._proc.stdout.close()
+                self._proc.wait(timeout=2.0)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+            self._proc = None
+
+    def _open(self, index: int):
+        self.close()
+        command: List[str] = [get_ffmpeg_exe(), "-hide_banner", "-loglevel", "error", "-nostdin"]
+        if index > 0:
+            command += ["-ss", f"{index / self.fps:.3f}"]
+        command += ["-i", self.filename, "-an", "-sn"]
+        command += ["-vf", f"scale={self.size[0]}:{self.size[1]}:flags={self.scale_flags}"]
+        command += ["-f", "rawvideo", "-pix_fmt", "rgb24", "-"]
+        self._proc = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL, bufsize=self._frame_bytes,
+                                      creationflags=_CREATION_FLAGS)
+        self._next_index = index
+
+    def _read_frame(self) -> bool:
+        """Read the next frame into the next buffer - returns False at the end of the stream"""
+        buffer = self._buffers[self._next_buffer]
+        view = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < self._frame_bytes:
+            count = self._proc.stdout.readinto(view[filled:])
+            if not count:
+                return False
+            filled += count
+        self._next_buffer = (self._next_buffer + 1) % len(self._buffers)
+        self._last_frame = buffer
+        self._next_index += 1
+        return True
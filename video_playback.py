@@ -0,0 +1,455 @@
+"""
+Video playback for Math Adventure Game
+A worker thread decodes video frames ahead of the presentation clock into a
+bounded ring buffer, so ffmpeg decode latency never stalls the render loop. The
+main loop only takes the buffered frame matching the current playback time and
+uploads it into surfaces that are reused for every frame. Readers are opened with
+ffmpeg scaling to the on-screen size, so frames arrive at display resolution.
+
+Playback time comes from a PresentationClock that starts once the first frame can
+be shown. Frames whose time has passed are dropped instead of shown late, the
+previous frame is held while the decoder is behind, and a decoder that falls far
+behind skips ahead to the clock.
+
+VideoPlayer ties these together for one on-screen video, taking its reader from a
+VideoReaderPool: finished videos hand their reader back rewound, and the pool keeps
+a few idle readers open for the next play and closes the rest.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import pygame
+
+from media_imports import get_numpy
+
+# Frames decoded ahead of the presentation clock
+VIDEO_BUFFER_FRAMES = 6
+# ffmpeg scaler used when a clip is decoded at display size
+VIDEO_RESIZE_ALGORITHM = "fast_bilinear"
+# When decoding falls this far behind the clock, skip ahead instead of decoding every frame
+VIDEO_CATCH_UP_SECONDS = 0.5
+# How far past the clock a skip lands, so decoding is ahead again once it resumes
+VIDEO_CATCH_UP_LEAD_SECONDS = 0.2
+# Idle video readers kept open for reuse (each may hold an ffmpeg process)
+VIDEO_READER_POOL_SIZE = 2
+
+
+def frame_to_surface(frame) -> pygame.Surface:
+    """Convert a (height, width, 3) RGB frame array to a pygame surface"""
+    np = get_numpy()
+    if np is not None:
+        # Swap axes: (height, width, 3) -> (width, height, 3) for pygame
+        return pygame.surfarray.make_surface(np.swapaxes(frame, 0, 1))
+    # Fallback: convert frame to pygame surface
+    return pygame.image.frombuffer(frame.tobytes(), (frame.shape[1], frame.shape[0]), "RGB")
+
+
+class FrameUploader:
+    """Writes decoded frames into one persistent surface, scaled into one persistent surface.
+
+    No surface is allocated per frame - only when the frame or target size changes.
+    """
+
+    def __init__(self):
+        self.surface: Optional[pygame.Surface] = None
+        self.scaled_surface: Optional[pygame.Surface] = None
+        self._scaled_stale = True  # A frame was uploaded since the last scale
+
+    def upload(self, frame) -> pygame.Surface:
+        """Copy a (height, width, 3) RGB frame array into the persistent frame surface"""
+        frame_size = (frame.shape[1], frame.shape[0])
+        if self.surface is None or self.surface.get_size() != frame_size:
+            # Display pixel format, so the scale and the screen blit need no conversion
+            self.surface = pygame.Surface(frame_size)
+            self.scaled_surface = None
+
+        np = get_numpy()
+        if np is not None:
+            # swapaxes is a strided view - blit_array reads the frame data in place
+            pygame.surfarray.blit_array(self.surface, np.swapaxes(frame, 0, 1))
+        else:
+            # Without numpy, wrap the frame's memory and blit it
+            self.surface.blit(pygame.image.frombuffer(memoryview(frame), frame_size, "RGB"), (0, 0))
+        self._scaled_stale = True
+        return self.surface
+
+    def scale(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Scale the last uploaded frame into the persistent scaled surface (held frames are not rescaled)"""
+        if size == self.surface.get_size():
+            return self.surface
+        if self.scaled_surface is None or self.scaled_surface.get_size() != size:
+            self.scaled_surface = pygame.Surface(size)
+            self._scaled_stale = True
+        if self._scaled_stale:
+            pygame.transform.scale(self.surface, size, self.scaled_surface)
+            self._scaled_stale = False
+        return self.scaled_surface
+
+    def release(self):
+        self.surface = None
+        self.scaled_surface = None
+
+
+class PresentationClock:
+    """Playback time of a video in seconds, from pygame.time.get_ticks() once started"""
+
+    def __init__(self):
+        self.start_ticks: Optional[int] = None
+
+    @property
+    def running(self) -> bool:
+        return self.start_ticks is not None
+
+    def start(self, now_ms: int):
+        self.start_ticks = now_ms
+
+    def reset(self):
+        self.start_ticks = None
+
+    def time(self, now_ms: int) -> float:
+        """Current playback time (0 until the clock is started)"""
+        if self.start_ticks is None:
+            return 0.0
+        return (now_ms - self.start_ticks) / 1000.0
+
+
+class VideoDecoder:
+    """Decodes a clip's frames in order on a worker thread into a bounded ring buffer"""
+
+    def __init__(self, clip, name: str = "Video", capacity: int = VIDEO_BUFFER_FRAMES, start_time: float = 0.0):
+        self.clip = clip
+        self.name = name
+        self.capacity = capacity
+        self.fps = clip.fps or 30
+        self.duration = clip.duration
+        self.frame_size = tuple(clip.size)  # Size the reader decodes at
+        self.start_time = start_time  # Playback time of the first decoded frame (a reopened clip resumes)
+        self._frames: Deque[Tuple[float, object]] = deque()  # (presentation time, frame) in order
+        self._condition = threading.Condition()
+        self._stopped = False
+        self.finished = False  # Every frame has been decoded
+        self.last_frame = None  # Final decoded frame, kept after the buffer drains
+
+        # Counters for get_stats()
+        self.frames_decoded = 0
+        self.frames_shown = 0
+        self.frames_dropped = 0  # Frames skipped because the clock had already passed them
+        self.frames_late = 0  # Frames shown more than one frame interval after their time
+        self.catch_ups = 0  # Times the decoder skipped ahead to the clock
+        self.underruns = 0  # Presentation times with no decoded frame ready yet
+        self.max_decode_lag = 0.0  # Worst time the clock was ahead of the newest decoded frame
+        self._newest_time = start_time  # Lag is measured from the first frame's time
+        self._clock_time = start_time  # Latest presentation time asked for, read by the worker
+
+        self._thread = threading.Thread(target=self._worker, name=f"{name}Decoder", daemon=True)
+        self._thread.start()
+
+    def has_frame(self) -> bool:
+        """Check if a decoded frame is ready (to start the presentation clock on)"""
+        with self._condition:
+            return bool(self._frames)
+
+    def get_frame(self, current_time: float):
+        """Take the newest buffered frame at or before current_time (None = keep showing the previous frame)
+
+        Older buffered frames are dropped - showing them would put the video behind the clock.
+        """
+        with self._condition:
+            self._clock_time = current_time
+            chosen = None
+            while self._frames and self._frames[0][0] <= current_time:
+                if chosen is not None:
+                    self.frames_dropped += 1
+                chosen = self._frames.popleft()
+            if chosen is not None:
+                self.frames_shown += 1
+                if current_time - chosen[0] > 1.0 / self.fps:
+                    self.frames_late += 1
+                # Space was freed - wake the decoder
+                self._condition.notify()
+            elif not self._frames and not self.finished:
+                self.underruns += 1
+
+            decode_lag = current_time - self._newest_time
+            if not self._frames and not self.finished and decode_lag > self.max_decode_lag:
+                self.max_decode_lag = decode_lag
+        return chosen[1] if chosen is not None else None
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return buffer depth and decode-lag metrics"""
+        with self._condition:
+            return {
+                'buffer_depth': len(self._frames),
+                'capacity': self.capacity,
+                'frames_decoded': self.frames_decoded,
+                'frames_shown': self.frames_shown,
+                'frames_dropped': self.frames_dropped,
+                'frames_late': self.frames_late,
+                'catch_ups': self.catch_ups,
+                'underruns': self.underruns,
+                'max_decode_lag_ms': self.max_decode_lag * 1000,
+            }
+
+    def format_stats(self) -> str:
+        """Return a one-line summary of the decoder metrics"""
+        stats = self.get_stats()
+        return (f"{self.name} decoder: {stats['frames_decoded']} frames decoded, {stats['frames_shown']} shown, "
+                f"{stats['frames_dropped']} dropped, {stats['frames_late']} late, "
+                f"{stats['catch_ups']} catch-ups, {stats['underruns']} underruns, "
+                f"buffer {stats['buffer_depth']}/{stats['capacity']}, "
+                f"max decode lag {stats['max_decode_lag_ms']:.0f} ms")
+
+    def stop(self) -> bool:
+        """Stop decoding and wait for the worker (call before closing the clip)
+
+        Returns False if the worker is still inside a read - its clip must then not be reused.
+        """
+        with self._condition:
+            self._stopped = True
+            self._frames.clear()
+            self._condition.notify_all()
+        self._thread.join(timeout=2.0)
+        return not self._thread.is_alive()
+
+    def _worker(self):
+        frame_index = int(self.start_time * self.fps)
+        while True:
+            frame_time = frame_index / self.fps
+            with self._condition:
+                if self._clock_time - frame_time > VIDEO_CATCH_UP_SECONDS:
+                    # Far behind the clock - every frame up to it would be dropped, so skip them
+                    skip_to = min(int((self._clock_time + VIDEO_CATCH_UP_LEAD_SECONDS) * self.fps),
+                                  int(self.duration * self.fps))
+                    self.frames_dropped += skip_to - frame_index
+                    self.catch_ups += 1
+                    frame_index = skip_to
+                    frame_time = frame_index / self.fps
+            if frame_time >= self.duration:
+                break
+            try:
+                # Sequential times let the reader stream forward without seeking
+                frame = self.clip.get_frame(frame_time)
+            except Exception as e:
+                print(f"Error decoding {self.name.lower()} video frame: {e}")
+                break
+
+            with self._condition:
+                while len(self._frames) >= self.capacity and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                self._frames.append((frame_time, frame))
+                self._newest_time = frame_time
+                self.last_frame = frame
+                self.frames_decoded += 1
+            frame_index += 1
+
+        with self._condition:
+            self.finished = True
+
+
+# Pool key: (video path, decode size or None for native frames)
+ReaderKey = Tuple[str, Optional[Tuple[int, int]]]
+
+
+class VideoReaderPool:
+    """Idle video readers kept open for reuse, keyed by path and decode size.
+
+    At most max_idle readers are kept - the least recently released ones are closed
+    first. Readers handed out by acquire must be given back with release (or closed).
+    """
+
+    def __init__(self, open_reader: Callable[[str, Optional[Tuple[int, int]]], object],
+                 max_idle: int = VIDEO_READER_POOL_SIZE):
+        self.open_reader = open_reader  # (path, decode size) -> reader, or None if none is available
+        self.max_idle = max_idle
+        self._idle: "OrderedDict[ReaderKey, object]" = OrderedDict()
+        self.opened = 0
+        self.reused = 0
+        self.closed = 0
+
+    def acquire(self, path: str, size: Optional[Tuple[int, int]]):
+        """Get a reader positioned at the first frame - an idle one if there is one, else a new one"""
+        key = (path, tuple(size) if size is not None else None)
+        reader = self._idle.pop(key, None)
+        if reader is not None:
+            self.reused += 1
+            return reader
+        reader = self.open_reader(path, size)
+        if reader is not None:
+            self.opened += 1
+        return reader
+
+    def release(self, reader, path: str, size: Optional[Tuple[int, int]]):
+        """Hand back a reader that is no longer read from - rewound and kept idle, or closed"""
+        key = (path, tuple(size) if size is not None else None)
+        if self.max_idle <= 0 or key in self._idle:
+            self._close(reader)
+            return
+        try:
+            rewind = getattr(reader, "rewind", None)
+            if rewind is not None:
+                rewind()
+        except Exception as e:
+            print(f"Error rewinding video reader for {path}: {e}")
+            self._close(reader)
+            return
+        self._idle[key] = reader
+        while len(self._idle) > self.max_idle:
+            _, oldest = self._idle.popitem(last=False)
+            self._close(oldest)
+
+    def discard(self, reader):
+        """Close a reader that cannot be reused (its decoder did not stop)"""
+        self._close(reader)
+
+    def close_all(self):
+        """Close every idle reader"""
+        while self._idle:
+            _, reader = self._idle.popitem(last=False)
+            self._close(reader)
+
+    def format_stats(self) -> str:
+        """Return a one-line summary of the pool"""
+        return (f"Video reader pool: {self.opened} opened, {self.reused} reused, {self.closed} closed, "
+                f"{len(self._idle)}/{self.max_idle} idle")
+
+    def _close(self, reader):
+        try:
+            reader.close()
+        except Exception as e:
+            print(f"Error closing video reader: {e}")
+        self.closed += 1
+
+
+class VideoPlayer:
+    """One on-screen video: a pooled reader, its decoder, the presentation clock and the frame surfaces
+
+    open() starts playback, update() advances it once per frame and finishes it at
+    the end, holding the final frame until close(). A finished or closed player has
+    handed its reader back to the pool.
+    """
+
+    def __init__(self, name: str, pool: VideoReaderPool):
+        self.name = name
+        self.pool = pool
+        self.path: Optional[str] = None
+        self.decode_size: Optional[Tuple[int, int]] = None  # Size the reader was opened at (None = native)
+        self.reader = None
+        self.decoder: Optional[VideoDecoder] = None
+        self.clock = PresentationClock()  # Starts once the first frame is decoded
+        self.uploader = FrameUploader()  # The last frame is held until the next is decoded
+        self.playing = False
+        self.finished = False  # Played to the end - the final frame is held
+
+    @property
+    def frame_surface(self) -> Optional[pygame.Surface]:
+        """The frame currently shown (None until the first frame is decoded)"""
+        return self.uploader.surface
+
+    def open(self, path: str, decode_size: Optional[Tuple[int, int]] = None) -> bool:
+        """Start playing a video from the beginning - returns False if it could not be opened"""
+        self.close()
+        self.path = path
+        self.decode_size = decode_size
+        try:
+            self.reader = self.pool.acquire(path, decode_size)
+            if self.reader is None:
+                return False
+            self.decoder = VideoDecoder(self.reader, self.name)
+        except Exception as e:
+            print(f"Error loading {self.name.lower()} video: {e}")
+            self._release_reader()
+            return False
+        self.playing = True
+        return True
+
+    def update(self, now_ms: int) -> Optional[pygame.Surface]:
+        """Advance playback to a pygame.time.get_ticks() time - returns the frame surface to show
+
+        The clock starts on the first decoded frame, so opening the reader does not count
+        as playback time. Past the end the player finishes and keeps the final frame.
+        """
+        if not self.playing:
+            return self.uploader.surface
+        if not self.clock.running:
+            if not self.decoder.has_frame() and not self.decoder.finished:
+                return None
+            self.clock.start(now_ms)
+
+        current_time = self.clock.time(now_ms)
+        if current_time >= self.reader.duration:
+            self.finish()
+            return self.uploader.surface
+        frame = self.decoder.get_frame(current_time)
+        if frame is not None:
+            self.uploader.upload(frame)
+        return self.uploader.surface
+
+    def reopen_at_size(self, decode_size: Optional[Tuple[int, int]]):
+        """Continue a playing video from a reader at another decode size (no-op if the size is unchanged)"""
+        if not self.playing or decode_size == self.decode_size:
+            return
+        current_time = self.clock.time(pygame.time.get_ticks())
+        old_reader, old_size = self.reader, self.decode_size
+        reader_reusable = self._stop_decoder()
+        try:
+            # Audio keeps playing from the extracted track, so the reader is video only
+            new_reader = self.pool.acquire(self.path, decode_size)
+            if new_reader is None:
+                raise IOError("no video reader available")
+        except Exception as e:
+            print(f"Error reopening video at new size: {e}")
+            if reader_reusable:
+                # Keep the old reader and carry on from where it stopped
+                self.decoder = VideoDecoder(old_reader, self.name, start_time=current_time)
+            else:
+                # The old decode thread is still reading it - a second decoder would share its frame buffers
+                self.pool.discard(old_reader)
+                self.reader = None
+                self.close()
+            return
+        if reader_reusable:
+            self.pool.release(old_reader, self.path, old_size)
+        else:
+            self.pool.discard(old_reader)
+        self.reader, self.decode_size = new_reader, decode_size
+        self.decoder = VideoDecoder(new_reader, self.name, start_time=current_time)
+        print(f"Reopened {self.name.lower()} video at {new_reader.size[0]}x{new_reader.size[1]}")
+
+    def finish(self):
+        """Stop at the end, holding the final frame, and hand the reader back"""
+        if self.decoder is not None and self.decoder.last_frame is not None:
+            # The final frame may have been decoded after the last update - show it
+            self.uploader.upload(self.decoder.last_frame)
+        self._release_reader()
+        self.playing = False
+        self.finished = True
+
+    def close(self):
+        """Stop playback, hand the reader back and drop the frame surfaces"""
+        self._release_reader()
+        self.uploader.release()
+        self.clock.reset()
+        self.playing = False
+        self.finished = False
+
+    def _stop_decoder(self) -> bool:
+        """Stop the decode thread and report its metrics - returns False if the reader is still in use"""
+        if self.decoder is None:
+            return True
+        reader_reusable = self.decoder.stop()
+        print(self.decoder.format_stats())
+        self.decoder = None
+        return reader_reusable
+
+    def _release_reader(self):
+        reader_reusable = self._stop_decoder()
+        if self.reader is not None:
+            if reader_reusable:
+                self.pool.release(self.reader, self.path, self.decode_size)
+            else:
+                self.pool.discard(self.reader)
+            self.reader = None
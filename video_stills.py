@@ -0,0 +1,81 @@
+"""
+Video stills for Math Adventure Game
+The MAIN MENU screen rests on its video's final frame. That frame is extracted
+once with ffmpeg on a background thread and stored as an image under the hash of
+the video's content, so later visits and launches load a small image instead of
+decoding the video to its end or seeking back into it.
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from asset_cache import USER_CACHE_DIR
+from audio_cache import hash_file
+from video_pipe import extract_last_frame
+
+VIDEO_STILL_CACHE_DIR = os.path.join(USER_CACHE_DIR, "video_stills")
+# Near-lossless JPEG - far smaller than PNG and much faster for ffmpeg to write
+STILL_EXTENSION = ".jpg"
+PARTIAL_SUFFIX = ".partial" + STILL_EXTENSION
+
+
+class VideoStillCache:
+    """Last frames of videos as image files, extracted on a worker thread and keyed by video content hash"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="VideoStill")
+        self._futures: Dict[str, Future] = {}  # Video path -> image path job (result None = failed)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(PARTIAL_SUFFIX):
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError as e:
+            print(f"Error preparing video still cache {self.cache_dir}: {e}")
+
+    def request_last_frame(self, video_path: str) -> Future:
+        """Get the image path of a video's last frame as a future - extracted in the background unless stored"""
+        future = self._futures.get(video_path)
+        if future is None or future.cancelled():
+            future = self._executor.submit(self._extract_last_frame, video_path)
+            self._futures[video_path] = future
+        return future
+
+    def get_last_frame(self, video_path: str) -> Optional[str]:
+        """Get the image path of a video's last frame if it is ready (None while extracting or if it failed)"""
+        future = self.request_last_frame(video_path)
+        if not future.done():
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Error extracting last frame of {video_path}: {e}")
+            return None
+
+    def shutdown(self):
+        """Stop the worker thread"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _extract_last_frame(self, video_path: str) -> Optional[str]:
+        try:
+            content_hash = hash_file(video_path)
+        except OSError as e:
+            print(f"Error reading video {video_path}: {e}")
+            return None
+        image_path = os.path.join(self.cache_dir, f"{content_hash}_last{STILL_EXTENSION}")
+        if os.path.exists(image_path):
+            return image_path
+
+        partial_path = os.path.join(self.cache_dir, content_hash + PARTIAL_SUFFIX)
+        if not extract_last_frame(video_path, partial_path):
+            return None
+        try:
+            os.replace(partial_path, image_path)
+        except OSError as e:
+            print(f"Error storing last frame of {video_path}: {e}")
+            return None
+        print(f"Extracted last frame: {video_path}")
+        return image_path